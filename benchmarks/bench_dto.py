@@ -0,0 +1,108 @@
+"""
+Rows per second turned into DTOs: per-row `from_model` over ORM entities
+(before) against the bulk `from_rows` / `from_models` paths over column
+tuples (after), for results, sessions and drivers.
+
+Rows are read once from the configured database and replicated with
+`--scale` so small local databases still give stable numbers. Both paths
+must produce identical JSON before anything is timed.
+
+Usage:
+  python -m benchmarks.bench_dto
+  python -m benchmarks.bench_dto --scale 200 --repeat 10
+"""
+import argparse
+import timeit
+from collections import defaultdict
+from typing import Callable, List, Tuple
+
+from src.core.database.database import SessionLocal
+from src.core.responses import dumps
+from src.v2.dto.drivers import DriverDto, DRIVER_COLUMNS
+from src.v2.dto.results import ResultDto, RESULT_COLUMNS
+from src.v2.dto.sessions import SessionDto
+from src.v2.models.driver import Driver as DriverModel
+from src.v2.models.result import Result as ResultModel
+from src.v2.models.session import Session as SessionModel
+from src.v2.models.standing import DriverStanding as DriverStandingModel
+
+def results_case(db, scale: int) -> Tuple[int, Callable, Callable]:
+  entities = db.query(ResultModel).order_by(ResultModel.id).all() * scale
+  rows = db.query(*RESULT_COLUMNS).order_by(ResultModel.id).all() * scale
+  before = lambda: [ResultDto.from_model(result) for result in entities]
+  after = lambda: ResultDto.from_rows(rows)
+  return len(rows), before, after
+
+def sessions_case(db, scale: int) -> Tuple[int, Callable, Callable]:
+  sessions = db.query(SessionModel).order_by(SessionModel.session_date, SessionModel.id).all()
+  entities_by_session = defaultdict(list)
+  for result in db.query(ResultModel).order_by(ResultModel.session_id, ResultModel.id).all():
+    entities_by_session[result.session_id].append(result)
+  rows = db.query(*RESULT_COLUMNS).order_by(ResultModel.session_id, ResultModel.id).all()
+
+  def before():
+    return [
+      SessionDto.from_model(session, results=[ResultDto.from_model(result) for result in entities_by_session[session.id]])
+      for _ in range(scale)
+      for session in sessions
+    ]
+
+  def after():
+    dtos = []
+    for _ in range(scale):
+      results_by_session = defaultdict(list)
+      for result in ResultDto.from_rows(rows):
+        results_by_session[result.session_id].append(result)
+      dtos.extend(SessionDto.from_models(sessions, results_by_session))
+    return dtos
+
+  # Sessions plus their embedded results
+  return (len(sessions) + len(rows)) * scale, before, after
+
+def drivers_case(db, scale: int) -> Tuple[int, Callable, Callable]:
+  join = DriverStandingModel.driver_number == DriverModel.permanentNumber
+  entities = db.query(DriverModel, DriverStandingModel).outerjoin(DriverStandingModel, join).order_by(DriverModel.id).all() * scale
+  rows = db.query(*DRIVER_COLUMNS).outerjoin(DriverStandingModel, join).order_by(DriverModel.id).all() * scale
+
+  def before():
+    return [
+      DriverDto.from_model(
+        driver=driver,
+        points=standing.points if standing else 0.0,
+        podiums=standing.podiums if standing else 0,
+        wins=standing.wins if standing else 0
+      )
+      for driver, standing in entities
+    ]
+
+  return len(rows), before, lambda: DriverDto.from_rows(rows)
+
+def best_rate(rows: int, fn: Callable, repeat: int) -> float:
+  seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+  return rows / seconds
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--scale", type=int, default=50, help="Replicate the stored rows this many times")
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  db = SessionLocal()
+  try:
+    cases: List[Tuple[str, Callable]] = [("results", results_case), ("sessions", sessions_case), ("drivers", drivers_case)]
+    print(f"{'dto':<10} {'rows':>8} {'before rows/s':>15} {'after rows/s':>15} {'speedup':>8}")
+    for name, build in cases:
+      rows, before, after = build(db, args.scale)
+      if not rows:
+        print(f"{name:<10} no rows")
+        continue
+      if dumps(before()) != dumps(after()):
+        raise SystemExit(f"{name}: bulk DTOs differ from from_model output")
+      before_rate = best_rate(rows, before, args.repeat)
+      after_rate = best_rate(rows, after, args.repeat)
+      print(f"{name:<10} {rows:>8} {before_rate:>15,.0f} {after_rate:>15,.0f} {after_rate / before_rate:>7.1f}x")
+  finally:
+    db.close()
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,120 @@
+"""
+Wall time of fetching and parsing the news listing plus every article:
+the sequential `requests` path of `get_news` against the concurrent aiohttp
+path (`fetch_articles`), both against a local stub server with a fixed
+per-response latency. Nothing is written to the database.
+
+Pages are generated to match the formula1.com selectors, or served from a
+directory of saved pages: `latest.html` is the listing and every other
+`<path>.html` is served at `/<path>`. Both paths must parse the same
+articles before anything is timed.
+
+Usage:
+  python -m benchmarks.bench_news_fetch
+  python -m benchmarks.bench_news_fetch --articles 40 --latency-ms 200 --concurrency 16 --per-host 8
+  python -m benchmarks.bench_news_fetch --pages ./saved_pages
+"""
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict
+
+import requests
+
+from src.v2.crawler.get_news import LATEST_PATH, fetch_articles, get_article_content, parse_listing
+from src.v2.crawler.http_cache import http_cache
+
+LISTING_TEMPLATE = """<html><body><main id="maincontent"><div><div><div><div>
+<div class="flex flex-col gap-px-48 lg:gap-px-64"><ul>{items}</ul></div>
+</div></div></div></div></main></body></html>"""
+
+ARTICLE_TEMPLATE = """<html><body><main id="maincontent"><div><div><div><div>
+<div class="flex flex-col gap-px-16 lg:gap-px-24 justify-between md:max-w-content-fixed-md lg:max-w-content-fixed-lg">
+<h1>Article {n}</h1>
+<div class="flex flex-col gap-rem-12 md:gap-rem-16 lg:gap-rem-24"><p>Description of article {n}</p></div>
+</div></div></div></div></div>
+<div class="content-rich-text">{paragraphs}<ul><li>First</li><li>Second</li></ul></div>
+</main></body></html>"""
+
+def generated_pages(articles: int, paragraphs: int) -> Dict[str, bytes]:
+  items = "".join(
+    f'<li><a href="/en/latest/article/article-{n}">Display {n}</a><img src="/img/{n}.jpg"></li>'
+    for n in range(articles)
+  )
+  pages = {LATEST_PATH: LISTING_TEMPLATE.format(items=items).encode()}
+  for n in range(articles):
+    body = "".join(f"<h2>Section {i}</h2><p>Paragraph {i} of article {n}. <a href='/x'>link</a></p>" for i in range(paragraphs))
+    pages[f"/en/latest/article/article-{n}"] = ARTICLE_TEMPLATE.format(n=n, paragraphs=body).encode()
+  return pages
+
+def saved_pages(directory: Path) -> Dict[str, bytes]:
+  pages = {}
+  for path in directory.rglob("*.html"):
+    relative = path.relative_to(directory).with_suffix("").as_posix()
+    pages[LATEST_PATH if relative == "latest" else "/" + relative] = path.read_bytes()
+  return pages
+
+def serve(pages: Dict[str, bytes], latency: float) -> ThreadingHTTPServer:
+  class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+      time.sleep(latency)
+      body = pages.get(self.path)
+      self.send_response(200 if body is not None else 404)
+      self.send_header("Content-Type", "text/html; charset=utf-8")
+      self.send_header("Content-Length", str(len(body or b"")))
+      self.end_headers()
+      self.wfile.write(body or b"")
+
+    def log_message(self, *args):
+      pass
+
+  server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+  server.daemon_threads = True
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  return server
+
+def fetch_sequential(base_url: str) -> dict:
+  entries = parse_listing(requests.get(base_url + LATEST_PATH).content, base_url)
+  return {entry["url"]: get_article_content(entry["url"]) for entry in entries}
+
+def fetch_concurrent(base_url: str, concurrency: int, per_host: int) -> dict:
+  articles = asyncio.run(fetch_articles(base_url, concurrency, per_host))
+  return {article["url"]: (article["title"], article["description"], article["content"]) for article in articles}
+
+def timed(fn, *args) -> tuple:
+  started = time.perf_counter()
+  result = fn(*args)
+  return result, time.perf_counter() - started
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--articles", type=int, default=20, help="Generated articles on the listing page")
+  parser.add_argument("--paragraphs", type=int, default=30, help="Paragraphs per generated article")
+  parser.add_argument("--pages", type=Path, help="Serve saved pages from this directory instead")
+  parser.add_argument("--latency-ms", type=float, default=150.0, help="Delay before every stub response")
+  parser.add_argument("--concurrency", type=int, default=8)
+  parser.add_argument("--per-host", type=int, default=4)
+  args = parser.parse_args()
+
+  # Time the network path; the on-disk cache would answer the second run
+  http_cache.enabled = False
+  pages = saved_pages(args.pages) if args.pages else generated_pages(args.articles, args.paragraphs)
+  server = serve(pages, args.latency_ms / 1000)
+  base_url = f"http://127.0.0.1:{server.server_address[1]}"
+  try:
+    expected, sequential = timed(fetch_sequential, base_url)
+    actual, concurrent = timed(fetch_concurrent, base_url, args.concurrency, args.per_host)
+  finally:
+    server.shutdown()
+
+  if expected != actual:
+    raise SystemExit("concurrent fetch parsed different articles than the sequential path")
+  print(f"{'path':<12} {'articles':>8} {'seconds':>9}")
+  print(f"{'sequential':<12} {len(expected):>8} {sequential:>9.2f}")
+  print(f"{'concurrent':<12} {len(actual):>8} {concurrent:>9.2f}   {sequential / concurrent:.1f}x")
+
+if __name__ == "__main__":
+  main()
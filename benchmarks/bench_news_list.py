@@ -0,0 +1,55 @@
+"""
+Payload size and latency of one `/v2/news` page: full rows with the article
+`content` through `NewsDto.from_model` (before) against the summary columns
+read by `NewsRepository.get_news_page` (after).
+
+Rows come from the configured database, so run `get_news` first or point
+SUPABASE_DB_URL at a database with realistic articles. Both paths must
+return the same items apart from `content` before anything is timed.
+
+Usage:
+  python -m benchmarks.bench_news_list
+  python -m benchmarks.bench_news_list --limit 50 --repeat 20
+"""
+import argparse
+import timeit
+
+import orjson
+
+from src.core.database.database import SessionLocal
+from src.core.responses import dumps
+from src.v2.dto.news import NewsDto
+from src.v2.models.news import News as NewsModel
+from src.v2.repositories.news import NewsRepository
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--limit", type=int, default=50, help="Page size, as in /v2/news?limit=")
+  parser.add_argument("--repeat", type=int, default=10)
+  args = parser.parse_args()
+
+  db = SessionLocal()
+  try:
+    def before():
+      rows = db.query(NewsModel).order_by(NewsModel.published_at.desc(), NewsModel.id.desc()).limit(args.limit + 1).all()
+      db.expunge_all()  # load the rows again on every run, as each request does
+      return dumps([NewsDto.from_model(news) for news in rows[:args.limit]])
+
+    def after():
+      return dumps(NewsRepository(db).get_news_page(args.limit).items)
+
+    full, summary = orjson.loads(before()), orjson.loads(after())
+    if not summary:
+      raise SystemExit("No news stored; run python -m src.v2.crawler.get_news first")
+    if [{key: value for key, value in item.items() if key != "content"} for item in full] != summary:
+      raise SystemExit("summary page differs from the full rows")
+
+    print(f"{'path':<8} {'items':>6} {'bytes':>10} {'ms':>9}")
+    for name, fn in (("before", before), ("after", after)):
+      ms = min(timeit.repeat(fn, number=1, repeat=args.repeat)) * 1000
+      print(f"{name:<8} {len(summary):>6} {len(fn()):>10,} {ms:>9.2f}")
+  finally:
+    db.close()
+
+if __name__ == "__main__":
+  main()
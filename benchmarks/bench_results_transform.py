@@ -0,0 +1,114 @@
+"""
+Per-session transform time of get_results: the previous per-driver
+`pick_drivers` / `iterrows()` code against the grouped lap statistics and
+column-wise result transform.
+
+Sessions come from the fastf1 cache (`./cache`), so run the crawler or load
+them once beforehand. Both implementations must produce the same rows
+before anything is timed.
+
+Usage:
+  python -m benchmarks.bench_results_transform                              # 2025 round 1 FP1 and race
+  python -m benchmarks.bench_results_transform --session 2025 3 Q --session 2025 3 R
+"""
+import argparse
+import timeit
+from typing import Any, Dict, List
+
+import fastf1
+import pandas as pd
+
+from src.v2.crawler.get_results import build_practice_results, build_session_results
+
+def legacy_practice_results(session_id: int, session) -> List[Dict[str, Any]]:
+  driver_results = []
+  for driver in session.drivers:
+    result = session.laps.pick_drivers(driver).pick_fastest()
+    time_val = None
+    if result is not None and pd.notna(result.get('LapTime')):
+      time_val = result['LapTime'].total_seconds()
+    driver_results.append({
+      "session_id": session_id,
+      "driver_number": int(driver),
+      "position": None,
+      "points": 0,
+      "laps_completed": len(session.laps.pick_drivers(driver)),
+      "Q1": 0.0,
+      "Q2": 0.0,
+      "Q3": 0.0,
+      "time": time_val if time_val is not None else 0.0,
+      "status": "Finished" if time_val is not None and time_val > 0 else "Retired"
+    })
+  driver_results.sort(key=lambda x: float('inf') if x["time"] == 0.0 else x["time"])
+  for i, driver_result in enumerate(driver_results, 1):
+    driver_result["position"] = i
+  return driver_results
+
+def legacy_session_results(session_id: int, session) -> List[Dict[str, Any]]:
+  driver_results = []
+  results = session.results
+  for _, result in results.iterrows():
+    q1 = result["Q1"].total_seconds() if pd.notna(result["Q1"]) else None
+    q2 = result["Q2"].total_seconds() if pd.notna(result["Q2"]) else None
+    q3 = result["Q3"].total_seconds() if pd.notna(result["Q3"]) else None
+    leader_time = None
+    if not results.empty and "Time" in results.columns and len(results) > 0:
+      leader_time = results["Time"].iloc[0].total_seconds() if pd.notna(results["Time"].iloc[0]) else None
+    time_val = None
+    if pd.notna(result.get("Time")):
+      try:
+        if int(result.get("Position", "")) == 1:
+          time_val = leader_time
+        elif leader_time is not None and hasattr(result["Time"], 'total_seconds'):
+          time_val = leader_time + result["Time"].total_seconds()
+      except Exception:
+        pass
+    if result["Status"] != "":
+      status = result["Status"]
+    else:
+      status = "Finished" if any(x is not None for x in [q1, q2, q3, time_val]) else "Retired"
+    driver_results.append({
+      "session_id": session_id,
+      "driver_number": int(result["DriverNumber"]),
+      "position": float(result["Position"]) if pd.notna(result["Position"]) else 0,
+      "points": float(result["Points"]) if pd.notna(result["Points"]) else 0,
+      "laps_completed": len(session.laps.pick_drivers(result["DriverNumber"])),
+      "Q1": q1 if q1 is not None else 0.0,
+      "Q2": q2 if q2 is not None else 0.0,
+      "Q3": q3 if q3 is not None else 0.0,
+      "time": time_val if time_val is not None else 0.0,
+      "status": status,
+    })
+  return driver_results
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--session", nargs=3, action="append", metavar=("YEAR", "ROUND", "SESSION"),
+                      help="Session to load from the fastf1 cache, repeatable")
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+
+  fastf1.set_log_level("ERROR")
+  fastf1.Cache.enable_cache("./cache")
+  sessions = args.session or [("2025", "1", "FP1"), ("2025", "1", "R")]
+
+  print(f"{'session':<14} {'rows':>5} {'before ms':>10} {'after ms':>10} {'speedup':>8}")
+  for year, round, code in sessions:
+    session = fastf1.get_session(int(year), int(round), code)
+    session.load(telemetry=False, weather=False, messages=False)
+    if code.upper().startswith("FP"):
+      before = lambda: legacy_practice_results(0, session)
+      after = lambda: build_practice_results(0, session.drivers, session.laps)
+    else:
+      before = lambda: legacy_session_results(0, session)
+      after = lambda: build_session_results(0, session.results, session.laps)
+
+    expected, actual = before(), after()
+    if expected != actual:
+      raise SystemExit(f"{year} {round} {code}: vectorized rows differ from the per-driver transform")
+    before_ms = min(timeit.repeat(before, number=1, repeat=args.repeat)) * 1000
+    after_ms = min(timeit.repeat(after, number=1, repeat=args.repeat)) * 1000
+    print(f"{year} {round:>2} {code:<6} {len(actual):>5} {before_ms:>10.2f} {after_ms:>10.2f} {before_ms / after_ms:>7.1f}x")
+
+if __name__ == "__main__":
+  main()
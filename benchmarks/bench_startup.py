@@ -0,0 +1,93 @@
+"""
+Cold-start cost of the API process: `import main` time and the time from
+spawning uvicorn to the first successful response. Fails when a module
+that should load lazily (pandas, numpy, fastf1) is imported by `main`.
+
+Every measurement runs in a fresh interpreter.
+
+Usage:
+  python -m benchmarks.bench_startup
+  python -m benchmarks.bench_startup --runs 10 --path /v2/circuits
+  python -m benchmarks.bench_startup --max-import-ms 800      # also fail above a time budget
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+# Must stay out of the API process until a code path needs them
+LAZY_MODULES = ("pandas", "numpy", "fastf1")
+
+IMPORT_PROBE = """
+import sys, time
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+print("import_seconds=" + repr(elapsed))
+print("lazy_loaded=" + ",".join(name for name in {lazy!r} if name in sys.modules))
+"""
+
+def measure_import() -> tuple:
+  output = subprocess.run(
+    [sys.executable, "-W", "ignore", "-c", IMPORT_PROBE.format(lazy=LAZY_MODULES)],
+    capture_output=True, text=True, check=True
+  ).stdout
+  values = dict(line.split("=", 1) for line in output.splitlines() if "=" in line)
+  return float(values["import_seconds"]), [name for name in values["lazy_loaded"].split(",") if name]
+
+def measure_first_response(port: int, path: str, timeout: float = 60.0) -> float:
+  started = time.perf_counter()
+  server = subprocess.Popen(
+    [sys.executable, "-W", "ignore", "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+    stdout=subprocess.DEVNULL
+  )
+  try:
+    while time.perf_counter() - started < timeout:
+      try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=timeout) as response:
+          if response.status == 200:
+            return time.perf_counter() - started
+      except (urllib.error.URLError, ConnectionError):
+        time.sleep(0.01)
+    raise SystemExit(f"No 200 from {path} within {timeout:g}s")
+  finally:
+    server.terminate()
+    server.wait()
+
+def summarize(label: str, samples: list) -> None:
+  ms = [sample * 1000 for sample in samples]
+  print(f"{label:<22} median {statistics.median(ms):8.1f} ms   min {min(ms):8.1f} ms   max {max(ms):8.1f} ms")
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--runs", type=int, default=5)
+  parser.add_argument("--path", default="/health", help="Route timed for the first response")
+  parser.add_argument("--port", type=int, default=8711)
+  parser.add_argument("--max-import-ms", type=float, help="Fail when the median import time exceeds this")
+  args = parser.parse_args()
+
+  measure_import()  # compile bytecode once so every run measures a warm .pyc cache
+
+  import_times, loaded = [], set()
+  for _ in range(args.runs):
+    seconds, lazy_loaded = measure_import()
+    import_times.append(seconds)
+    loaded.update(lazy_loaded)
+  response_times = [measure_first_response(args.port, args.path) for _ in range(args.runs)]
+
+  summarize("import main", import_times)
+  summarize(f"first {args.path}", response_times)
+
+  failures = []
+  if loaded:
+    failures.append(f"`import main` loaded {', '.join(sorted(loaded))}; keep these imports inside the code paths that use them")
+  if args.max_import_ms is not None and statistics.median(import_times) * 1000 > args.max_import_ms:
+    failures.append(f"median import time is above {args.max_import_ms:g} ms")
+  if failures:
+    raise SystemExit("\n".join(failures))
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,71 @@
+"""
+Compare the pure Python and pandas paths of `analyze_weather_conditions`
+on real fastf1 weather payloads.
+
+Usage:
+  python -m benchmarks.bench_weather                       # payloads stored in sessions.weather
+  python -m benchmarks.bench_weather --fastf1 2025 1 R     # one session loaded through the fastf1 cache
+"""
+import argparse
+import timeit
+from typing import List
+
+from src.v2.utils.analyze_weather import analyze_weather_conditions, _analyze_with_pandas
+
+def load_from_db(limit: int) -> List[list]:
+  from sqlalchemy.orm import undefer
+  from src.core.database.database import SessionLocal
+  from src.v2.models.session import Session as SessionModel
+  
+  db = SessionLocal()
+  try:
+    sessions = db.query(SessionModel)\
+                 .options(undefer(SessionModel.weather))\
+                 .filter(SessionModel.weather.isnot(None))\
+                 .limit(limit)\
+                 .all()
+    return [session.weather for session in sessions if isinstance(session.weather, list) and session.weather]
+  finally:
+    db.close()
+
+def load_from_fastf1(year: int, round: int, session_code: str) -> List[list]:
+  import fastf1
+  fastf1.Cache.enable_cache("./cache")
+  session = fastf1.get_session(year, round, session_code)
+  session.load(laps=False, telemetry=False, weather=True, messages=False)
+  weather_df = session.weather_data.copy()
+  for col in weather_df.select_dtypes(include=['timedelta64']).columns:
+    weather_df[col] = weather_df[col].astype(str)
+  return [weather_df.to_dict(orient='records')]
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--fastf1", nargs=3, metavar=("YEAR", "ROUND", "SESSION"), help="Load one session through fastf1 instead of the database")
+  parser.add_argument("--limit", type=int, default=200, help="Maximum number of stored sessions to use")
+  parser.add_argument("--repeat", type=int, default=5)
+  args = parser.parse_args()
+  
+  if args.fastf1:
+    year, round, session_code = args.fastf1
+    payloads = load_from_fastf1(int(year), int(round), session_code)
+  else:
+    payloads = load_from_db(args.limit)
+  if not payloads:
+    raise SystemExit("No weather payloads found")
+  
+  mismatches = [i for i, payload in enumerate(payloads) if analyze_weather_conditions(payload) != _analyze_with_pandas(payload)]
+  if mismatches:
+    raise SystemExit(f"Fast path output differs from pandas for payloads {mismatches}")
+  
+  samples = sum(len(payload) for payload in payloads)
+  print(f"{len(payloads)} payloads, {samples} samples ({samples / len(payloads):.0f} per payload), outputs identical")
+  
+  timings = {}
+  for name, func in (("pandas", _analyze_with_pandas), ("fast", analyze_weather_conditions)):
+    best = min(timeit.repeat(lambda: [func(payload) for payload in payloads], number=1, repeat=args.repeat))
+    timings[name] = best
+    print(f"{name:>6}: {best * 1000:8.2f} ms total, {best / len(payloads) * 1e6:8.1f} µs per payload")
+  print(f"speedup: {timings['pandas'] / timings['fast']:.1f}x")
+
+if __name__ == "__main__":
+  main()
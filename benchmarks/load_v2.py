@@ -0,0 +1,162 @@
+"""
+Load test comparing the sync (thread pool) and async (event loop) database
+paths of the v2 API under increasing concurrency.
+
+Both apps serve the same repository calls without the response cache, so
+every request reaches the database. Each app runs in its own uvicorn
+process; the client fires `--requests` requests per concurrency level and
+reports throughput and latency percentiles.
+
+Usage:
+  python -m benchmarks.load_v2                                  # /v2/sessions?fields=id,year,round,session_name
+  python -m benchmarks.load_v2 --path "/v2/results?driver_number=1" --concurrency 1 16 64 256
+  python -m benchmarks.load_v2 --db-delay 20                    # add a pg_sleep per request (PostgreSQL only)
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.database.database import get_db, get_async_db
+from src.v2.repositories.drivers import DriverRepository, AsyncDriverRepository
+from src.v2.repositories.results import ResultRepository, AsyncResultRepository
+from src.v2.repositories.sessions import SessionRepository, AsyncSessionRepository
+
+SESSION_FIELDS = ("id", "year", "round", "session_name")
+
+# Seconds of simulated database latency per request, set by the parent process
+DB_DELAY = float(os.environ.get("LOAD_V2_DB_DELAY", "0"))
+
+sync_app = FastAPI()
+async_app = FastAPI()
+
+def _sync_delay(db: Session) -> None:
+  if DB_DELAY:
+    db.execute(text("SELECT pg_sleep(:delay)"), {"delay": DB_DELAY})
+
+async def _async_delay(db: AsyncSession) -> None:
+  if DB_DELAY:
+    await db.execute(text("SELECT pg_sleep(:delay)"), {"delay": DB_DELAY})
+
+@sync_app.get("/v2/sessions")
+def sync_sessions(db: Session = Depends(get_db)):
+  _sync_delay(db)
+  return SessionRepository(db).get_sessions(SESSION_FIELDS, ())
+
+@sync_app.get("/v2/results")
+def sync_results(driver_number: int, db: Session = Depends(get_db)):
+  _sync_delay(db)
+  return ResultRepository(db).get_results_by_driver_number(driver_number)
+
+@sync_app.get("/v2/drivers")
+def sync_drivers(db: Session = Depends(get_db)):
+  _sync_delay(db)
+  return DriverRepository(db).get_drivers()
+
+@async_app.get("/v2/sessions")
+async def async_sessions(db: AsyncSession = Depends(get_async_db)):
+  await _async_delay(db)
+  return await AsyncSessionRepository(db).get_sessions(SESSION_FIELDS, ())
+
+@async_app.get("/v2/results")
+async def async_results(driver_number: int, db: AsyncSession = Depends(get_async_db)):
+  await _async_delay(db)
+  return await AsyncResultRepository(db).get_results_by_driver_number(driver_number)
+
+@async_app.get("/v2/drivers")
+async def async_drivers(db: AsyncSession = Depends(get_async_db)):
+  await _async_delay(db)
+  return await AsyncDriverRepository(db).get_drivers()
+
+def start_server(app_name: str, port: int, db_delay: float) -> subprocess.Popen:
+  env = {**os.environ, "LOAD_V2_DB_DELAY": str(db_delay)}
+  return subprocess.Popen(
+    [sys.executable, "-m", "uvicorn", f"benchmarks.load_v2:{app_name}", "--port", str(port), "--log-level", "warning"],
+    env=env,
+    stdout=subprocess.DEVNULL
+  )
+
+async def wait_until_up(base_url: str, path: str, timeout: float = 30.0) -> None:
+  deadline = time.monotonic() + timeout
+  async with httpx.AsyncClient(base_url=base_url) as client:
+    while time.monotonic() < deadline:
+      try:
+        if (await client.get(path)).status_code == 200:
+          return
+      except httpx.TransportError:
+        pass
+      await asyncio.sleep(0.2)
+  raise SystemExit(f"Server at {base_url} did not answer {path}")
+
+async def run_level(base_url: str, path: str, concurrency: int, requests: int) -> dict:
+  latencies: List[float] = []
+  errors = 0
+  remaining = iter(range(requests))
+
+  async def worker(client: httpx.AsyncClient) -> None:
+    nonlocal errors
+    for _ in remaining:
+      started = time.perf_counter()
+      try:
+        response = await client.get(path)
+        if response.status_code != 200:
+          errors += 1
+      except httpx.HTTPError:
+        errors += 1
+      latencies.append(time.perf_counter() - started)
+
+  limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+  async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+  latencies.sort()
+  return {
+    "rps": requests / elapsed,
+    "p50": statistics.median(latencies) * 1000,
+    "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    "errors": errors,
+  }
+
+async def benchmark(app_name: str, port: int, args: argparse.Namespace) -> List[Optional[dict]]:
+  server = start_server(app_name, port, args.db_delay / 1000)
+  base_url = f"http://127.0.0.1:{port}"
+  try:
+    await wait_until_up(base_url, args.path)
+    await run_level(base_url, args.path, 4, 50)  # warm the pool
+    return [await run_level(base_url, args.path, level, max(args.requests, level)) for level in args.concurrency]
+  finally:
+    server.terminate()
+    server.wait()
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument("--path", default="/v2/sessions", help="/v2/sessions, /v2/results?driver_number=N or /v2/drivers")
+  parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64, 128])
+  parser.add_argument("--requests", type=int, default=500, help="Requests per concurrency level")
+  parser.add_argument("--db-delay", type=float, default=0, help="Milliseconds of pg_sleep added to every request")
+  parser.add_argument("--port", type=int, default=8701)
+  args = parser.parse_args()
+
+  sync_stats = asyncio.run(benchmark("sync_app", args.port, args))
+  async_stats = asyncio.run(benchmark("async_app", args.port + 1, args))
+
+  print(f"{args.path}  ({args.requests} requests per level, db delay {args.db_delay:g} ms)")
+  print(f"{'concurrency':>11} | {'sync req/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'err':>4} | {'async req/s':>11} {'p50 ms':>8} {'p95 ms':>8} {'err':>4}")
+  for level, sync, async_ in zip(args.concurrency, sync_stats, async_stats):
+    print(f"{level:>11} | {sync['rps']:>10.1f} {sync['p50']:>8.1f} {sync['p95']:>8.1f} {sync['errors']:>4} | "
+          f"{async_['rps']:>11.1f} {async_['p50']:>8.1f} {async_['p95']:>8.1f} {async_['errors']:>4}")
+
+if __name__ == "__main__":
+  main()
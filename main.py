@@ -1,10 +1,30 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from src.core.config import Settings
+from src.core.responses import ORJSONResponse
+from src.core.database.database import dispose_engines, ping_database, warm_async_pool
 import uvicorn
 
 settings = Settings()
-app = FastAPI()
+
+async def warm_pool():
+    opened = await warm_async_pool(settings.DB_POOL_WARM_CONNECTIONS)
+    if opened:
+        print(f"✅ Database pool warmed with {opened} connections")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 커넥션 풀 예열은 백그라운드에서 진행되므로 DB가 느려도 서버 기동을 막지 않습니다
+    warm_task = asyncio.create_task(warm_pool())
+    yield
+    warm_task.cancel()
+    await asyncio.gather(warm_task, return_exceptions=True)
+    await dispose_engines()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS 미들웨어 설정
 app.add_middleware(
@@ -13,6 +33,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Link", "X-Next-Cursor"],
 )
 
 # from src.v1.router import routers as v1_routers
@@ -37,8 +58,15 @@ async def root():
 
 @app.get("/health")
 def health_check():
+    # 프로세스 생존 확인용으로 DB에 접근하지 않습니다
     return {"status": "ok"}
 
+@app.get("/ready")
+async def readiness_check():
+    if await ping_database(settings.READY_TIMEOUT):
+        return {"status": "ready"}
+    return JSONResponse(status_code=503, content={"status": "unavailable"})
+
 if __name__ == "__main__":
     # 0.0.0.0으로 설정하면 모든 네트워크 인터페이스에서 접근 가능합니다.
     # 포트는 8000을 사용하지만 필요시 변경 가능합니다.
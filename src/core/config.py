@@ -24,6 +24,23 @@ class Settings(BaseSettings):
   
   TIMEZONE: str = "Asia/Seoul"
   
+  # Response cache for the v2 read routes
+  CACHE_ENABLED: bool = True
+  CACHE_MAX_ENTRIES: int = 512
+  CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+  CACHE_VERSION_CHECK_INTERVAL: float = 5.0  # seconds between data_versions reads
+  
+  # Database connections opened in the background at startup (capped at the pool size)
+  DB_POOL_WARM_CONNECTIONS: int = 5
+  READY_TIMEOUT: float = 2.0  # seconds /ready waits for the database
+  
+  # Crawlers skip a finished session once it was ingested this long after it started
+  INGEST_SETTLE_HOURS: float = 48.0
+  
+  # On-disk HTTP cache of the crawlers (see src/v2/crawler/http_cache.py)
+  HTTP_CACHE_ENABLED: bool = True
+  HTTP_CACHE_DIR: str = "./cache/http"
+  
   @property
   def API_VERSION(self) -> str:
     return f"v{self.VERSION}"
@@ -1,3 +1,9 @@
-from .database import engine, Base, SessionLocal, get_db
+from . import database
+from .database import Base, get_db, get_async_db, get_engine, get_async_engine, get_session_local, get_async_session_local
 
-__all__ = ['engine', 'Base', 'SessionLocal', 'get_db']
+__all__ = ['engine', 'Base', 'SessionLocal', 'get_db', 'async_engine', 'AsyncSessionLocal', 'get_async_db',
+           'get_engine', 'get_async_engine', 'get_session_local', 'get_async_session_local']
+
+def __getattr__(name: str):
+    # engine / SessionLocal and their async counterparts are created on first use
+    return getattr(database, name)
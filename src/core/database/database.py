@@ -1,4 +1,7 @@
-from sqlalchemy import create_engine
+import asyncio
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
@@ -31,28 +34,125 @@ if is_postgresql:
 else:
     connect_args = {"check_same_thread": False}
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    pool_size=10,  # Increased from 5
-    max_overflow=20,  # Increased from 10
-    pool_timeout=60,  # Increased from 30
-    pool_pre_ping=True,  # Enable connection health checks
-    pool_recycle=300,  # Recycle connections after 5 minutes (reduced from 30)
-    pool_use_lifo=True,  # Use last-in-first-out for better connection reuse
-    connect_args=connect_args,
-    echo=False  # Set to True for debugging SQL queries
-)
-
-try:
-  engine.connect()
-  print("✅ Database connection successful!")
-except Exception as e:
-  print(f"❌ Database connection failed: {str(e)}")
-  raise
-
-# 세션 팩토리 생성
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_async_database_url(database_url: str) -> str:
+    """
+    Async driver URL for the configured database: asyncpg for PostgreSQL,
+    aiosqlite for the local SQLite file.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "postgresql":
+        query = dict(url.query)
+        # asyncpg takes `ssl` instead of libpq's `sslmode`
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        return url.set(drivername="postgresql+asyncpg", query=query).render_as_string(hide_password=False)
+    if url.get_backend_name() == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    return database_url
+
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+
+# 엔진과 세션 팩토리는 처음 사용할 때 생성됩니다 (import 시점에 DB에 접속하지 않음)
+_engine = None
+_session_local = None
+_async_engine = None
+_async_session_local = None
+
+def get_engine() -> Engine:
+    """동기 엔진 (크롤러와 스크립트에서 사용)"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            DATABASE_URL,
+            pool_size=10,  # Increased from 5
+            max_overflow=20,  # Increased from 10
+            pool_timeout=60,  # Increased from 30
+            pool_pre_ping=True,  # Enable connection health checks
+            pool_recycle=300,  # Recycle connections after 5 minutes (reduced from 30)
+            pool_use_lifo=True,  # Use last-in-first-out for better connection reuse
+            connect_args=connect_args,
+            echo=False  # Set to True for debugging SQL queries
+        )
+    return _engine
+
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진 (v2 API 라우터에서 사용)"""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=60,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            pool_use_lifo=True,
+            connect_args={'timeout': 10} if is_postgresql else {},
+            echo=False
+        )
+    return _async_engine
+
+def get_session_local() -> sessionmaker:
+    global _session_local
+    if _session_local is None:
+        _session_local = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    return _session_local
+
+def get_async_session_local() -> async_sessionmaker:
+    global _async_session_local
+    if _async_session_local is None:
+        _async_session_local = async_sessionmaker(bind=get_async_engine(), class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    return _async_session_local
+
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "SessionLocal": get_session_local,
+    "async_engine": get_async_engine,
+    "AsyncSessionLocal": get_async_session_local,
+}
+
+def __getattr__(name: str):
+    # `from src.core.database.database import engine` keeps working, but only builds the engine on first use
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+async def warm_async_pool(connections: int) -> int:
+    """
+    Open up to `connections` pooled connections at once and return them to the
+    pool, so the first requests do not pay for the connect. Returns how many
+    connections were opened.
+    """
+    engine = get_async_engine()
+    # Connections beyond pool_size are overflow and would be closed again on return
+    size = getattr(engine.pool, "size", lambda: connections)()
+    held = [engine.connect() for _ in range(max(0, min(connections, size)))]
+    try:
+        results = await asyncio.gather(*(connection.start() for connection in held), return_exceptions=True)
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            print(f"❌ Database connection failed: {str(failures[0])}")
+        return len(held) - len(failures)
+    finally:
+        await asyncio.gather(*(connection.close() for connection in held), return_exceptions=True)
+
+async def ping_database(timeout: float) -> bool:
+    """One round trip through the async pool, bounded by `timeout` seconds."""
+    async def ping() -> None:
+        async with get_async_engine().connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    try:
+        await asyncio.wait_for(ping(), timeout)
+        return True
+    except Exception:
+        return False
+
+async def dispose_engines() -> None:
+    """Close pooled connections of every engine created so far."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
 
 def get_db():
     """
@@ -62,8 +162,19 @@ def get_db():
     # Import all models to ensure they are loaded
     from src.v2.models import Circuit, Session, Driver, Team, Result
     
-    db = SessionLocal()
+    db = get_session_local()()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션을 생성하고 관리하는 의존성 함수
+    FastAPI의 Depends와 함께 사용
+    """
+    # Import all models to ensure they are loaded
+    from src.v2.models import Circuit, Session, Driver, Team, Result
+    
+    async with get_async_session_local()() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,37 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from .base import Base
+
+def ensure_schema(engine: Engine, metadata=Base.metadata) -> None:
+    """
+    Create missing tables, then add the nullable columns and indexes that
+    `create_all` skips on tables which already exist.
+    """
+    metadata.create_all(bind=engine)
+    
+    inspector = inspect(engine)
+    preparer = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                if not column.nullable:
+                    print(f"⚠️  Column {table.name}.{column.name} is NOT NULL, add it with a migration.")
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} {column_type}"
+                ))
+                print(f"Added column {table.name}.{column.name}")
+    
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except SQLAlchemyError as e:
+                # e.g. a unique index over rows that still hold duplicates
+                print(f"⚠️  Could not create index {index.name}: {str(e).splitlines()[0]}")
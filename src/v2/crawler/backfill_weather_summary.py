@@ -0,0 +1,54 @@
+import argparse
+from sqlalchemy.orm import undefer
+from src.v2.models.session import Session as SessionModel
+from src.v2.utils.analyze_weather import summarize_weather
+from src.core.database.database import SessionLocal
+from src.v2.repositories.data_versions import DataVersionRepository
+
+def backfill_weather_summary(db, force: bool = False, batch_size: int = 20):
+  """Compute `weather_summary` for sessions stored before it was precomputed at ingest."""
+  query = db.query(SessionModel.id).filter(SessionModel.weather.isnot(None))
+  if not force:
+    query = query.filter(SessionModel.weather_summary.is_(None))
+  session_ids = [session_id for (session_id,) in query.order_by(SessionModel.id).all()]
+  print(f"Sessions to backfill: {len(session_ids)}")
+  
+  for start in range(0, len(session_ids), batch_size):
+    batch = db.query(SessionModel)\
+              .options(undefer(SessionModel.weather))\
+              .filter(SessionModel.id.in_(session_ids[start:start + batch_size]))\
+              .all()
+    for session in batch:
+      session.weather_summary = summarize_weather(session.weather)
+    db.commit()
+    # Raw weather payloads are large, drop them from the identity map between batches
+    db.expunge_all()
+    print(f"Backfilled {min(start + batch_size, len(session_ids))}/{len(session_ids)} sessions")
+  
+  if session_ids:
+    DataVersionRepository(db).bump("sessions")
+
+def init_db():
+    """Initialize the database by creating all tables."""
+    from src.core.database.database import engine
+    from src.core.database.schema import ensure_schema
+    print("Creating database tables...")
+    ensure_schema(engine)
+    print("Database tables created!")
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Backfill precomputed session weather summaries")
+  parser.add_argument("--force", action="store_true", help="Recompute summaries that are already stored")
+  args = parser.parse_args()
+  
+  init_db()
+  
+  db = SessionLocal()
+  try:
+    backfill_weather_summary(db, force=args.force)
+  except Exception as e:
+    print(f"Error backfilling weather summaries: {str(e)}")
+    db.rollback()
+    raise
+  finally:
+    db.close()
@@ -1,7 +1,8 @@
 from src.core.config import Settings
 from src.core.database.database import SessionLocal
 from src.v2.models.circuit import Circuit
-import requests
+from src.v2.repositories.data_versions import DataVersionRepository
+from src.v2.crawler.http_cache import http_cache
 import pandas as pd
 from bs4 import BeautifulSoup
 
@@ -41,15 +42,20 @@ def convert_lap_time_to_seconds(lap_time_str):
       return float(minutes) * 60 + float(seconds)
     return float(lap_time_str)
   
+def parse_country_codes(html):
+  """Country name to code, from the flagsapi.com index page."""
+  soup = BeautifulSoup(html, "html.parser")
+  codes = {}
+  for country in soup.find_all("div", "item_country"):
+    code, name = country.find_all("p")[0].text, country.find_all("p")[1].text
+    codes.setdefault(name, code)
+  return codes
+
 def get_country_code(country_name: str):
   url = "https://flagsapi.com/"
-  response = requests.get(url)
+  response = http_cache.fetch(url)
   if response.status_code == 200:
-    soup = BeautifulSoup(response.content, "html.parser")
-    div = soup.find_all("div", "item_country")
-    for country in div:
-      if country.find_all("p")[1].text == country_name:
-        return country.find_all("p")[0].text
+    return http_cache.parsed(response, parse_country_codes).get(country_name)
   else:
     print(f"Failed to retrieve the page. Status code: {response.status_code}")
     return None
@@ -64,7 +70,7 @@ def get_circuit_basic_info(circuit_key: int):
     }
     
     try:
-      circuit_info = requests.get(f"https://api.multiviewer.app/api/v1/circuits/{circuit_key}/{settings.now.year}", headers=headers)
+      circuit_info = http_cache.fetch(f"https://api.multiviewer.app/api/v1/circuits/{circuit_key}/{settings.now.year}", headers=headers)
       if circuit_info.status_code != 200:
         print(f"Error fetching circuit: {circuit_info.status_code} - {circuit_info.text}")
         return None
@@ -90,35 +96,52 @@ def get_circuit_basic_info(circuit_key: int):
       print(f"Error getting circuit: {str(e)}")
       return None
 
+def parse_circuit_hrefs(html):
+  soup = BeautifulSoup(html, "html.parser")
+  hrefs = []
+  for i in range(2, 26):
+    href = soup.select_one(rf"#maincontent > div > div.Container-module_container__0e4ac.colors-module_bg_colour-surface-neutral-surface-neutral-3__u3lwa > div > div > div.grid.justify-items-stretch.items-center.gap-px-12.\@\[738px\]\/cards\:gap-px-16.lg\:gap-px-24.grid-cols-1.\@\[640px\]\/cards\:grid-cols-2.\@\[1320px\]\/cards\:grid-cols-3 > a:nth-child({i})")['href']
+    hrefs.append(href)
+  return hrefs
+
 def get_formula1_circuit_info_href():
   url = "https://www.formula1.com/en/racing/2025"
-  response = requests.get(url)
+  response = http_cache.fetch(url)
   hrefs = []
 
   if response.status_code == 200:
-      soup = BeautifulSoup(response.content, "html.parser")
-      for i in range(2, 26):
-        href = soup.select_one(rf"#maincontent > div > div.Container-module_container__0e4ac.colors-module_bg_colour-surface-neutral-surface-neutral-3__u3lwa > div > div > div.grid.justify-items-stretch.items-center.gap-px-12.\@\[738px\]\/cards\:gap-px-16.lg\:gap-px-24.grid-cols-1.\@\[640px\]\/cards\:grid-cols-2.\@\[1320px\]\/cards\:grid-cols-3 > a:nth-child({i})")['href']
-        hrefs.append(href)
+      hrefs = http_cache.parsed(response, parse_circuit_hrefs)
   else:
       print(f"Failed to retrieve the page. Status code: {response.status_code}")
 
   return hrefs
 
+def parse_circuit_page(html):
+  """Track facts from a formula1.com circuit page."""
+  soup = BeautifulSoup(html, "html.parser")
+  image = soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.border-\[rgb\(from_var\(--f1rd-colour-surface-neutral-surface-neutral-11\)_r_g_b_\/_0\.1\)\].border-b-thin.md\:border-b-0.pb-px-48.md\:pb-0.md\:pr-px-32.md\:border-r-thin.min-h-\[300px\].max-h-\[220px\].md\:max-h-inherit.flex.justify-center.items-center > img")['src']
+  circuit_length = soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div.pt-px-16.pb-px-32.grid.gap-y-px-4.grid-cols-1.grid-rows-subgrid.row-span-3.border-\[rgb\(from_var\(--f1rd-colour-surface-neutral-surface-neutral-11\)_r_g_b_\/_0\.1\)\].col-span-2 > dd").text
+  first_grand_prix = int(soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(2) > dd").text)
+  number_of_laps = int(soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(3) > dd").text)
+  fastest_lap_time = {
+    "lap_time": convert_lap_time_to_seconds(soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(4) > dd").text),
+    "driver": soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(4) > span").text
+  }
+  race_distance = soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(5) > dd").text
+  return {
+    "image": image,
+    "circuit_length": circuit_length,
+    "first_grand_prix": first_grand_prix,
+    "number_of_laps": number_of_laps,
+    "fastest_lap_time": fastest_lap_time,
+    "race_distance": race_distance
+  }
+
 def get_formula1_circuit_info(href):
   url = "https://www.formula1.com" + href
-  response = requests.get(url)
+  response = http_cache.fetch(url)
   if response.status_code == 200:
-    soup = BeautifulSoup(response.content, "html.parser")
-    image = soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.border-\[rgb\(from_var\(--f1rd-colour-surface-neutral-surface-neutral-11\)_r_g_b_\/_0\.1\)\].border-b-thin.md\:border-b-0.pb-px-48.md\:pb-0.md\:pr-px-32.md\:border-r-thin.min-h-\[300px\].max-h-\[220px\].md\:max-h-inherit.flex.justify-center.items-center > img")['src']
-    circuit_length = soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div.pt-px-16.pb-px-32.grid.gap-y-px-4.grid-cols-1.grid-rows-subgrid.row-span-3.border-\[rgb\(from_var\(--f1rd-colour-surface-neutral-surface-neutral-11\)_r_g_b_\/_0\.1\)\].col-span-2 > dd").text
-    first_grand_prix = int(soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(2) > dd").text)
-    number_of_laps = int(soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(3) > dd").text)
-    fastest_lap_time = {
-      "lap_time": convert_lap_time_to_seconds(soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(4) > dd").text),
-      "driver": soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(4) > span").text
-    }
-    race_distance = soup.select_one(r"#maincontent > div > div:nth-child(3) > div > div > div > div.w-full.grid.grid-cols-1.md\:grid-cols-2 > div.pt-px-16.md\:pl-px-32 > dl > div:nth-child(5) > dd").text
+    page = http_cache.parsed(response, parse_circuit_page)
     
     circuit_data = get_circuit_basic_info(circuit_key[href.split("/")[-1]])
     
@@ -128,12 +151,7 @@ def get_formula1_circuit_info(href):
       "location": circuit_data.get("location"),
       "country": circuit_data.get("country"),
       "country_code": circuit_data.get("country_code"),
-      "image": image,
-      "circuit_length": circuit_length,
-      "first_grand_prix": first_grand_prix,
-      "number_of_laps": number_of_laps,
-      "fastest_lap_time": fastest_lap_time,
-      "race_distance": race_distance
+      **page
     }
     return circuit_info
   
@@ -171,6 +189,9 @@ def save_circuit_info(db):
         db.commit()
         db.refresh(new_circuit)
         print(f"Added new circuit: {new_circuit.name}")
+  
+  # Invalidate cached API responses that depend on circuits
+  DataVersionRepository(db).bump("circuits")
     
 def init_db():
     """Initialize the database by creating all tables."""
@@ -193,4 +214,5 @@ if __name__ == "__main__":
         db.rollback()
     finally:
         db.close()
+        http_cache.report()
     
\ No newline at end of file
@@ -3,6 +3,7 @@ from datetime import datetime
 from ..utils.load_json import load_json
 from pathlib import Path
 from src.core.database.database import SessionLocal
+from src.v2.repositories.data_versions import DataVersionRepository
 
 def get_drivers(session, drivers_data):
   for driver_data in drivers_data:
@@ -47,6 +48,7 @@ if __name__ == "__main__":
     drivers_data = load_json(base_path / 'data' / 'F1Drivers.json')
     get_drivers(session, drivers_data)
     session.commit()
+    DataVersionRepository(session).bump("drivers")
     print(f"Processed {len(drivers_data)} drivers.")
   except Exception as e:
     print(f"An error occurred: {str(e)}")
@@ -1,7 +1,17 @@
-import requests
+import argparse
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
 from src.v2.models.news import News
 from src.core.database.database import SessionLocal
+from src.v2.repositories.data_versions import DataVersionRepository
+from src.v2.repositories.news_search import NewsSearchRepository, ensure_news_search, has_news_search
+from src.v2.crawler.watermarks import fingerprint
+from src.v2.crawler.http_cache import http_cache
 from datetime import date, datetime, timezone
 
 def process_content(soup):
@@ -45,9 +55,27 @@ def process_content(soup):
         custom_tag = f"[ORDERED_LIST]\n" + "\n".join(list_items) + "\n[/ORDERED_LIST]"
         ol.replace_with(custom_tag)
 
-def get_article_content(url):
-    response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
+LATEST_PATH = "/en/latest?articleFilters=Article&page=3"
+
+# Article fields covered by News.content_hash
+HASHED_COLUMNS = ("title", "display_title", "description", "content", "thumbnail")
+
+def parse_listing(html, base_url) -> List[Dict[str, str]]:
+    """Display title, thumbnail and absolute url of each article on the listing page."""
+    soup = BeautifulSoup(html, "html.parser")
+    entries = []
+    
+    articles = soup.select(r"#maincontent > div > div > div > div > div.flex.flex-col.gap-px-48.lg\:gap-px-64 > ul > li")
+    for article in articles:
+        entries.append({
+          "display_title": article.select_one("a").get_text(strip=True),
+          "thumbnail": article.select_one("img")["src"],
+          "url": base_url + article.select_one("a")["href"]
+        })
+    return entries
+
+def parse_article(html) -> Tuple[str, str, str]:
+    soup = BeautifulSoup(html, "html.parser")
     title = soup.find_all("h1")[0].get_text(strip=True)
     description = soup.select_one(r"#maincontent > div > div:nth-child(1) > div > div > div.flex.flex-col.gap-px-16.lg\:gap-px-24.justify-between.md\:max-w-content-fixed-md.lg\:max-w-content-fixed-lg > div.flex.flex-col.gap-rem-12.md\:gap-rem-16.lg\:gap-rem-24 > p").get_text(strip=True)
     process_content(soup)
@@ -56,77 +84,173 @@ def get_article_content(url):
         content += article.get_text(separator='\n', strip=True)
     
     return title, description, content
+
+def get_article_content(url):
+    response = http_cache.fetch(url)
+    response.raise_for_status()
+    return http_cache.parsed(response, parse_article)
+
+def article_data(entry: Dict[str, str], title: str, description: str, content: str) -> Dict[str, Any]:
+    return {
+      "display_title": entry["display_title"],
+      "title": title,
+      "description": description,
+      "content": content,
+      "thumbnail": entry["thumbnail"],
+      "url": entry["url"],
+      "published_at": datetime.now(timezone.utc)
+    }
   
 def get_news(db, base_url):
-    response = requests.get(base_url + "/en/latest?articleFilters=Article&page=3")
-    soup = BeautifulSoup(response.content, "html.parser")
+    response = http_cache.fetch(base_url + LATEST_PATH)
+    response.raise_for_status()
     
-    articles = soup.select(r"#maincontent > div > div > div > div > div.flex.flex-col.gap-px-48.lg\:gap-px-64 > ul > li")
-    for article in articles:
-        thumbnail = article.select_one("img")["src"]
-        href = article.select_one("a")["href"]
-        display_title = article.select_one("a").get_text(strip=True)
-        
-        title, description, content = get_article_content(base_url + href)
-        
-        article_data = {
-          "display_title": display_title,
-          "title": title,
-          "description": description,
-          "content": content,
-          "thumbnail": thumbnail,
-          "url": base_url + href,
-          "published_at": datetime.now(timezone.utc)
-        }
-        
-        save_news(db, article_data)
+    written = 0
+    for entry in http_cache.parsed(response, parse_listing, base_url):
+        title, description, content = get_article_content(entry["url"])
+        written += save_news(db, article_data(entry, title, description, content))
+    
+    if written:
+        # Invalidate cached API responses that depend on news
+        DataVersionRepository(db).bump("news")
+
+async def fetch_page(session: aiohttp.ClientSession, url: str):
+    response = await http_cache.fetch_async(session, url)
+    response.raise_for_status()
+    return response
+
+async def fetch_article(session: aiohttp.ClientSession, entry: Dict[str, str]) -> Dict[str, Any]:
+    response = await fetch_page(session, entry["url"])
+    title, description, content = await http_cache.parsed_async(response, parse_article)
+    return article_data(entry, title, description, content)
+
+async def fetch_articles(base_url, concurrency: int = 8, per_host: int = 4, timeout: float = 30.0) -> List[Dict[str, Any]]:
+    """
+    Download the listing page, then fetch and parse every article concurrently.
+    `concurrency` caps open connections overall and `per_host` per host.
+    Articles that fail are reported and left out.
+    """
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        entries = http_cache.parsed(await fetch_page(session, base_url + LATEST_PATH), parse_listing, base_url)
+        fetched = await asyncio.gather(*(fetch_article(session, entry) for entry in entries), return_exceptions=True)
+    
+    articles = []
+    for entry, result in zip(entries, fetched):
+        if isinstance(result, Exception):
+            print(f"Error fetching {entry['url']}: {str(result) or type(result).__name__}")
+            continue
+        articles.append(result)
+    print(f"Fetched {len(articles)}/{len(entries)} articles")
+    return articles
+
+def get_news_async(db, base_url, concurrency: int = 8, per_host: int = 4):
+    articles = asyncio.run(fetch_articles(base_url, concurrency, per_host))
+    
+    # One statement and transaction for the whole batch
+    if save_news_batch(db, articles):
+        # Invalidate cached API responses that depend on news
+        DataVersionRepository(db).bump("news")
         
-def save_news(db, data):
-  existing_news = db.query(News).filter(
-    News.title == data["title"],
-    News.display_title == data["display_title"],
-    News.description == data["description"],
-    News.content == data["content"],
-    News.thumbnail == data["thumbnail"],
-    News.url == data["url"]
-  ).first()
-  
-  if existing_news:
-    # Update existing news
-    for key, value in data.items():
-      setattr(existing_news, key, value)
-    existing_news.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(existing_news)
-    print(f"Updated news: {data['title']}")
-  else:
-    # Create new news
-    data["created_at"] = datetime.now(timezone.utc)
-    data["updated_at"] = datetime.now(timezone.utc)
-    news = News(**data)
-    db.add(news)
-    db.commit()
-    print(f"Saved new news: {data['title']}")
+def content_hash(data: Dict[str, Any]) -> str:
+    return fingerprint({column: data[column] for column in HASHED_COLUMNS})
+
+def save_news_batch(db, articles: List[Dict[str, Any]]) -> int:
+    """
+    Upsert articles keyed on url with one INSERT ... ON CONFLICT (url) DO
+    UPDATE in one transaction. Existing rows are only rewritten when their
+    content hash changed; created_at and published_at keep the first ingest.
+    The search index is updated for the written rows in the same transaction.
+    Returns the number of rows inserted or updated.
+    """
+    # Last occurrence wins when the listing repeats an article
+    by_url = {data["url"]: data for data in articles}
+    if not by_url:
+        return 0
+    
+    now = datetime.now(timezone.utc)
+    rows = [{**data, "content_hash": content_hash(data), "created_at": now, "updated_at": now} for data in by_url.values()]
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stored = {
+      url: (news_id, stored_hash)
+      for url, news_id, stored_hash in db.query(News.url, News.id, News.content_hash).filter(News.url.in_(list(by_url))).all()
+    }
+    changed_urls = [row["url"] for row in rows if stored.get(row["url"], (None, None))[1] != row["content_hash"]]
+    search_index = NewsSearchRepository(db)
+    
+    statement = insert(News).values(rows)
+    updated_columns = {key: statement.excluded[key] for key in rows[0] if key not in ("url", "created_at", "published_at")}
+    statement = statement.on_conflict_do_update(
+      index_elements=["url"],
+      set_=updated_columns,
+      where=News.content_hash.is_distinct_from(statement.excluded.content_hash)
+    )
+    try:
+        search_index.remove(stored[url][0] for url in changed_urls if url in stored)
+        written = db.execute(statement).rowcount
+        search_index.add(news_id for news_id, in db.query(News.id).filter(News.url.in_(changed_urls)).all())
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    print(f"Saved {written} new or changed news, {len(rows) - written} unchanged")
+    return written
+
+def save_news(db, data) -> int:
+    return save_news_batch(db, [data])
+
+def dedupe_news(engine) -> None:
+    """
+    Keep the newest row per url so the unique index backing the upsert can
+    be created on databases written by the old six-column matching.
+    """
+    with Session(engine) as db:
+        duplicates = [news_id for news_id, in db.execute(text(
+            "SELECT id FROM news WHERE id NOT IN (SELECT MAX(id) FROM news GROUP BY url)"
+        )).all()]
+        if not duplicates:
+            return
+        # Drop them from an existing search index first, it reads the rows back from `news`
+        if has_news_search(db.connection()):
+            NewsSearchRepository(db).remove(duplicates)
+        db.query(News).filter(News.id.in_(duplicates)).delete(synchronize_session=False)
+        db.commit()
+    print(f"Removed {len(duplicates)} duplicate news")
     
 def init_db():
     """Initialize the database by creating all tables."""
-    from src.core.database.database import Base, engine
+    from src.core.database.database import engine
+    from src.core.database.schema import ensure_schema
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    if inspect(engine).has_table("news"):
+      dedupe_news(engine)
+    ensure_schema(engine)
+    ensure_news_search(engine)
     print("Database tables created!")
     
 
 if __name__ == "__main__":  
+    parser = argparse.ArgumentParser(description="Ingest the latest formula1.com articles")
+    parser.add_argument("--mode", choices=["async", "sync"], default="async",
+                        help="async: fetch and parse articles concurrently, one commit (default); sync: one article and commit at a time")
+    parser.add_argument("--base-url", default="https://www.formula1.com")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent requests in async mode")
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host in async mode")
+    args = parser.parse_args()
+    
     init_db()
     
     db = SessionLocal()
     try:
-      base_url = "https://www.formula1.com"
-      
-      get_news(db, base_url)
+      if args.mode == "async":
+        get_news_async(db, args.base_url, args.concurrency, args.per_host)
+      else:
+        get_news(db, args.base_url)
     except Exception as e:
       print(f"Error in get_news: {str(e)}")
       raise
     finally:
       db.close()
+      http_cache.report()
         
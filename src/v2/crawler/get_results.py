@@ -1,11 +1,20 @@
+import argparse
 import fastf1
 import pandas as pd
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime, timezone
+from sqlalchemy import func, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
 from src.v2.models.driver import Driver as DriverModel
 from src.v2.models.result import Result as ResultModel
 from src.v2.models.session import Session as SessionModel
+from src.v2.models.team import Team as TeamModel
+from src.v2.repositories.standings import StandingRepository
+from src.v2.repositories.data_versions import DataVersionRepository
+from src.v2.repositories.ingest_state import IngestStateRepository
 from src.core.database.database import SessionLocal
+from src.v2.crawler.parallel import run_in_pool
+from src.v2.crawler.watermarks import as_utc, fingerprint, ingest_key, is_complete
 from src.core.config import Settings
 
 settings = Settings()
@@ -44,23 +53,100 @@ def get_event_by_round(round):
   event = fastf1.get_event(settings.now.year, round)
   return event
 
-def determine_status(result: Dict[str, Any], q1: Optional[float], q2: Optional[float], 
-                   q3: Optional[float], time_val: Optional[float]) -> str:
-    if result["Status"] != "":
-        return result["Status"]
-    return "Finished" if any(x is not None for x in [q1, q2, q3, time_val]) else "Retired"
-  
-def check_session(db, year, round, session_name):
-  session = db.query(SessionModel).filter(
-    SessionModel.year == year,
-    SessionModel.round == round,
-    SessionModel.session_name == session_name,
-    SessionModel.session_type == session_name_to_session_type.get(session_name, "Unknown")
-  ).first()
-  if not session:
-    print(f"Session {session_name} not found in database, skipping session.")
-    return None
-  return session
+def get_lap_stats(laps: pd.DataFrame) -> pd.DataFrame:
+  """
+  Fastest personal best lap time (seconds) and lap count per DriverNumber in
+  one grouped pass; the same values as `pick_drivers(driver).pick_fastest()`
+  and `len(pick_drivers(driver))`.
+  """
+  if laps is None or laps.empty or "DriverNumber" not in laps.columns:
+    return pd.DataFrame({"fastest": pd.Series(dtype=float), "laps": pd.Series(dtype=int)})
+  drivers = laps["DriverNumber"]
+  personal_bests = laps["LapTime"].where(laps["IsPersonalBest"] == True)
+  return pd.DataFrame({
+    "fastest": personal_bests.groupby(drivers).min().dt.total_seconds(),
+    "laps": drivers.groupby(drivers).size()
+  })
+
+def build_practice_results(session_id: int, drivers: List[str], laps: pd.DataFrame) -> List[Dict[str, Any]]:
+  """Practice rows ranked by each driver's fastest lap; drivers without a timed lap go last."""
+  lap_stats = get_lap_stats(laps)
+  fastest = lap_stats["fastest"].to_dict()
+  lap_counts = lap_stats["laps"].to_dict()
+  
+  driver_results = []
+  for driver in drivers:
+    time_val = fastest.get(driver)
+    if time_val is not None and pd.isna(time_val):
+      time_val = None
+    driver_results.append({
+      "session_id": session_id,
+      "driver_number": int(driver),
+      "position": None,
+      "points": 0,
+      "laps_completed": int(lap_counts.get(driver, 0)),
+      "Q1": 0.0,
+      "Q2": 0.0,
+      "Q3": 0.0,
+      "time": time_val if time_val is not None else 0.0,
+      "status": "Finished" if time_val is not None and time_val > 0 else "Retired"
+    })
+  
+  # Sort driver results, placing drivers with time=0 at the end
+  driver_results.sort(key=lambda x: float('inf') if x["time"] == 0.0 else x["time"])
+  
+  # Assign positions
+  for i, driver_result in enumerate(driver_results, 1):
+    # Each driver gets a unique position number
+    driver_result["position"] = i
+  return driver_results
+
+def build_session_results(session_id: int, results: pd.DataFrame, laps: pd.DataFrame) -> List[Dict[str, Any]]:
+  """Qualifying, sprint and race rows from `session.results`, transformed column-wise."""
+  if results is None or results.empty:
+    return []
+  lap_counts = get_lap_stats(laps)["laps"]
+  
+  q1, q2, q3 = (results[column].dt.total_seconds() for column in ("Q1", "Q2", "Q3"))
+  position = results["Position"].astype(float)
+  if "Time" in results.columns:
+    time_seconds = results["Time"].dt.total_seconds()
+  else:
+    time_seconds = pd.Series(float("nan"), index=results.index)
+  
+  # The leader's Time is the race time, every other driver's is the gap to the leader
+  leader_time = time_seconds.iloc[0]
+  time_val = (time_seconds + leader_time).where(position != 1, leader_time)
+  time_val = time_val.where(time_seconds.notna() & position.notna())
+  
+  has_time = q1.notna() | q2.notna() | q3.notna() | time_val.notna()
+  status = results["Status"].where(results["Status"] != "", has_time.map({True: "Finished", False: "Retired"}))
+  
+  rows = pd.DataFrame({
+    "session_id": session_id,
+    "driver_number": results["DriverNumber"].astype(int),
+    "position": position.fillna(0),
+    "points": results["Points"].astype(float).fillna(0),
+    "laps_completed": results["DriverNumber"].map(lap_counts).fillna(0).astype(int),
+    "Q1": q1.fillna(0.0),
+    "Q2": q2.fillna(0.0),
+    "Q3": q3.fillna(0.0),
+    "time": time_val.fillna(0.0),
+    "status": status.astype(object).where(status.notna(), None),
+  })
+  return rows.to_dict(orient="records")
+
+SessionKey = Tuple[int, int, str, str]
+
+def session_key(year, round, session_name) -> SessionKey:
+  return (year, int(round), session_name, session_name_to_session_type.get(session_name, "Unknown"))
+
+def get_session_ids(db, year) -> Dict[SessionKey, int]:
+  """Ids of every stored session of the season keyed by `session_key`, loaded with one query."""
+  rows = db.query(
+    SessionModel.id, SessionModel.year, SessionModel.round, SessionModel.session_name, SessionModel.session_type
+  ).filter(SessionModel.year == year).all()
+  return {(year, round, session_name, session_type): id for id, year, round, session_name, session_type in rows}
   
 def save_result(db, result_data):
   driver_exists = db.query(DriverModel).filter(DriverModel.permanentNumber == result_data["driver_number"]).first()
@@ -76,6 +162,8 @@ def save_result(db, result_data):
   if existing_result:
     # Update existing result
     for key, value in result_data.items():
+      if key == "constructor_id" and existing_result.constructor_id:
+        continue
       setattr(existing_result, key, value)
     existing_result.updated_at = datetime.now(timezone.utc)
     db.commit()
@@ -90,10 +178,133 @@ def save_result(db, result_data):
     db.commit()
     print(f"Saved new result for driver {result_data['driver_number']} in session {result_data['session_id']}")
 
-def main():
+def get_driver_teams(db) -> Dict[int, str]:
+  """Current team of every stored driver, keyed by driver number."""
+  return {number: team for number, team in db.query(DriverModel.permanentNumber, DriverModel.currentTeam).all()}
+
+def get_known_teams(db) -> Set[str]:
+  return {constructor_id for (constructor_id,) in db.query(TeamModel.constructorId).all()}
+
+def session_teams(results: Optional[pd.DataFrame]) -> Dict[int, str]:
+  """fastf1's TeamId per driver number, empty when the session has no results table."""
+  if results is None or results.empty or "TeamId" not in results.columns:
+    return {}
+  teams = results[["DriverNumber", "TeamId"]].dropna()
+  return dict(zip(teams["DriverNumber"].astype(int), teams["TeamId"].astype(str)))
+
+def assign_constructors(results: List[Dict[str, Any]], driver_teams: Dict[int, str], known_teams: Set[str]) -> List[Dict[str, Any]]:
+  """
+  Team of every row: fastf1's TeamId when it is a stored constructor,
+  otherwise the driver's current team, which is the team of the session
+  just ingested. The upsert never overwrites a team once stored.
+  """
+  return [
+    {**row, "constructor_id": row.get("constructor_id") if row.get("constructor_id") in known_teams else driver_teams.get(row["driver_number"])}
+    for row in results
+  ]
+
+def save_results(db, results: List[Dict[str, Any]], known_drivers: Set[int]) -> int:
+  """
+  Write all results of one session with a single INSERT ... ON CONFLICT
+  (session_id, driver_number) DO UPDATE in one transaction.
+  Returns the number of rows written.
+  """
+  rows = []
+  for result_data in results:
+    if result_data["driver_number"] not in known_drivers:
+      print(f"Driver number {result_data['driver_number']} not found in database, skipping result.")
+      continue
+    rows.append(result_data)
+  if not rows:
+    return 0
+  
+  now = datetime.now(timezone.utc)
+  rows = [{**row, "created_at": now, "updated_at": now} for row in rows]
+  dialect = db.get_bind().dialect.name
+  insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+  statement = insert(ResultModel).values(rows)
+  # created_at keeps the time of the first ingest
+  updated_columns = {key: statement.excluded[key] for key in rows[0] if key not in ("session_id", "driver_number", "created_at")}
+  if "constructor_id" in updated_columns:
+    # as does the team, so a later driver swap cannot move points of past sessions
+    updated_columns["constructor_id"] = func.coalesce(ResultModel.constructor_id, statement.excluded.constructor_id)
+  statement = statement.on_conflict_do_update(index_elements=["session_id", "driver_number"], set_=updated_columns)
+  try:
+    db.execute(statement)
+    db.commit()
+  except Exception:
+    db.rollback()
+    raise
+  print(f"Upserted {len(rows)} results in session {rows[0]['session_id']}")
+  return len(rows)
+
+def dedupe_results(engine) -> None:
+  """
+  Keep the newest row per (session_id, driver_number) so the unique index
+  backing the bulk upsert can be created on databases written by row mode.
+  """
+  with engine.begin() as conn:
+    deleted = conn.execute(text(
+      "DELETE FROM results WHERE id NOT IN "
+      "(SELECT MAX(id) FROM results GROUP BY session_id, driver_number)"
+    )).rowcount
+  if deleted:
+    print(f"Removed {deleted} duplicate results")
+
+def load_session_results(year: int, round: int, session_name: str, session_type: str, session_id: int) -> List[Dict[str, Any]]:
+  """Load one session with fastf1 and build its result rows. Safe to run in a worker process."""
+  session = fastf1.get_session(year, round, session_name)
+  session.load()
+  if "FP" in session_type:
+    rows = build_practice_results(session_id, session.drivers, session.laps)
+  else:
+    rows = build_session_results(session_id, session.results, session.laps)
+  teams = session_teams(session.results)
+  for row in rows:
+    row["constructor_id"] = teams.get(row["driver_number"])
+  return rows
+
+def write_session_results(
+  key: str,
+  driver_results: List[Dict[str, Any]],
+  mode: str,
+  driver_teams: Dict[int, str],
+  known_teams: Set[str],
+  previous: Optional[str] = None
+) -> None:
+  """Write one session's rows unless they match the `previous` fingerprint, then record the ingest."""
+  digest = fingerprint(driver_results)
+  if digest == previous:
+    print(f"Results unchanged: {key}")
+    IngestStateRepository(db).mark("results", key, digest)
+    return
+  
+  driver_results = assign_constructors(driver_results, driver_teams, known_teams)
+  if mode == "bulk":
+    save_results(db, driver_results, set(driver_teams))
+  else:
+    for result_data in driver_results:
+      save_result(db, result_data)
+  
+  # Keep the materialized standings in sync with the session just ingested
+  StandingRepository(db).refresh()
+  # Invalidate cached API responses that depend on results
+  DataVersionRepository(db).bump("results", "standings")
+  IngestStateRepository(db).mark("results", key, digest)
+
+def main(mode: str = "bulk", workers: int = 1, force: bool = False):
   schedules = get_schedules()
   rounds = schedules['RoundNumber'].to_list()
+  driver_teams = get_driver_teams(db)
+  known_teams = get_known_teams(db)
+  session_ids = get_session_ids(db, settings.now.year)
+  states = IngestStateRepository(db).get_states("results")
+  now = datetime.now(timezone.utc)
   
+  # Resolve every scheduled session before loading any data
+  planned_rounds = []
+  missing_sessions = []
+  skipped = 0
   for round in rounds:
     event = get_event_by_round(round)
     session_types = []
@@ -102,99 +313,71 @@ def main():
       session_name = getattr(event, f'Session{i}', None)
       if session_name and pd.notna(session_name):
         session_type = session_name_to_session_code.get(session_name, "Unknown")
-        session_types.append((session_name, session_type))
-        
-    for session_name, session_type in session_types:
-      session = event.get_session(session_name)
-      session.load()
+        session_id = session_ids.get(session_key(settings.now.year, round, session_name))
+        session_date = as_utc(getattr(event, f'Session{i}DateUtc', None))
+        state = states.get(ingest_key(settings.now.year, round, session_type))
+        if session_id is None:
+          missing_sessions.append((round, session_name))
+        elif session_date is not None and session_date > now:
+          # Not started yet, so there are no results to load
+          skipped += 1
+        elif not force and is_complete(state, session_date):
+          skipped += 1
+        else:
+          session_types.append((session_name, session_type, session_id))
+    planned_rounds.append((round, event, session_types))
+  
+  if missing_sessions:
+    print(f"⚠️  {len(missing_sessions)} sessions not found in database, run get_sessions first. Skipping:")
+    for round, session_name in missing_sessions:
+      print(f"  - Round {round}: {session_name}")
+  print(f"Sessions to ingest: {sum(len(session_types) for _, _, session_types in planned_rounds)}, already complete or not started: {skipped}")
+  
+  def write(year, round, session_type, driver_results):
+    key = ingest_key(year, round, session_type)
+    state = states.get(key)
+    write_session_results(key, driver_results, mode, driver_teams, known_teams, None if force or state is None else state.fingerprint)
+  
+  if workers > 1:
+    # Workers load and transform sessions; this process is the only writer
+    jobs = [
+      (f"Round {round} {session_name}", (settings.now.year, int(round), session_name, session_type, session_id))
+      for round, event, session_types in planned_rounds
+      for session_name, session_type, session_id in session_types
+    ]
+    run_in_pool(jobs, load_session_results, workers,
+                lambda args, driver_results: write(args[0], args[1], args[3], driver_results))
+    return
+  
+  for round, event, session_types in planned_rounds:
+    for session_name, session_type, session_id in session_types:
       print("#" * 50)
       print(f"Processing session: Round {round}, Session: {session_name} (Type: {session_type})")
       print("#" * 50)
-      if "FP" in session_type:
-        drivers = session.drivers
-        
-        # Store all driver results to calculate positions later
-        driver_results = []
-        
-        for driver in drivers:
-          result = session.laps.pick_drivers(driver).pick_fastest()
-          
-          time_val = None
-          if result is not None and pd.notna(result.get('LapTime')):
-            time_val = result['LapTime'].total_seconds()
-            
-          result_data = {
-            "session_id": check_session(db, settings.now.year, round, session_name).id,
-            "driver_number": driver,
-            "position": None,
-            "points": 0,
-            "laps_completed": len(session.laps.pick_drivers(driver)),
-            "Q1": 0.0,
-            "Q2": 0.0,
-            "Q3": 0.0,
-            "time": time_val if time_val is not None else 0.0,
-            "status": "Finished" if time_val is not None and time_val > 0 else "Retired"
-          }
-          
-          driver_results.append(result_data)
-        
-        # Sort driver results, placing drivers with time=0 at the end
-        driver_results.sort(key=lambda x: float('inf') if x["time"] == 0.0 else x["time"])
-        
-        # Assign positions
-        for i, driver_result in enumerate(driver_results, 1):
-          # Each driver gets a unique position number
-          driver_result["position"] = i
-          save_result(db, driver_result)
-        
-      else:
-        results = session.results
-        for _, result in results.iterrows():
-          q1 = result["Q1"].total_seconds() if pd.notna(result["Q1"]) else None
-          q2 = result["Q2"].total_seconds() if pd.notna(result["Q2"]) else None
-          q3 = result["Q3"].total_seconds() if pd.notna(result["Q3"]) else None
-          
-          leader_time = None
-          if not results.empty and "Time" in results.columns and len(results) > 0:
-              leader_time = results["Time"].iloc[0].total_seconds() if pd.notna(results["Time"].iloc[0]) else None
-          
-          time_val = None
-          if pd.notna(result.get("Time")):
-              try:
-                  if int(result.get("Position", "")) == 1:  # Leader
-                      time_val = leader_time
-                  elif leader_time is not None and hasattr(result["Time"], 'total_seconds'):
-                      time_val = leader_time + result["Time"].total_seconds()
-              except Exception as e:
-                  print(f"⚠️  Error calculating time for driver {result['DriverNumber']}: {e}")
-          
-          
-          status = determine_status(result, q1, q2, q3, time_val)
-          
-          result_data = {
-            "session_id": check_session(db, settings.now.year, round, session_name).id,
-            "driver_number": result["DriverNumber"],
-            "position": result["Position"] if pd.notna(result["Position"]) else 0,
-            "points": result["Points"] if pd.notna(result["Points"]) else 0,
-            "laps_completed": len(session.laps.pick_drivers(result["DriverNumber"])),
-            "Q1": q1 if q1 is not None else 0.0,
-            "Q2": q2 if q2 is not None else 0.0,
-            "Q3": q3 if q3 is not None else 0.0,
-            "time": time_val if time_val is not None else 0.0,
-            "status": status,
-          }
-          
-          save_result(db, result_data)
+      driver_results = load_session_results(settings.now.year, int(round), session_name, session_type, session_id)
+      write(settings.now.year, round, session_type, driver_results)
     
 def init_db():
     """Initialize the database by creating all tables."""
-    from src.core.database.database import Base, engine
+    from src.core.database.database import engine
+    from src.core.database.schema import ensure_schema
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    if inspect(engine).has_table("results"):
+      dedupe_results(engine)
+    ensure_schema(engine)
     print("Database tables created!")
     
     
 if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description="Ingest session results of the current season")
+  parser.add_argument("--mode", choices=["bulk", "row"], default="bulk",
+                      help="bulk: one upsert per session (default); row: one SELECT and commit per driver")
+  parser.add_argument("--workers", type=int, default=1,
+                      help="Load and transform sessions in this many processes; results are still written by one process")
+  parser.add_argument("--force", action="store_true",
+                      help="Reload every started session, including settled sessions that are already ingested")
+  args = parser.parse_args()
+  
   # Initialize the database first
   init_db()
   
@@ -202,7 +385,7 @@ if __name__ == "__main__":
   db = SessionLocal()
   
   try:
-    main()
+    main(args.mode, args.workers, args.force)
   except Exception as e:
     print(f"Error in get_results: {str(e)}")
     raise
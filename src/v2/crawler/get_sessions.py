@@ -1,10 +1,17 @@
+import argparse
 import fastf1
 from src.core.config import Settings
 import pandas as pd
 from src.v2.models.circuit import Circuit as CircuitModel
 from src.v2.models.session import Session as SessionModel
 from src.core.database.database import SessionLocal
+from src.v2.utils.analyze_weather import summarize_weather
+from src.v2.repositories.data_versions import DataVersionRepository
+from src.v2.repositories.ingest_state import IngestStateRepository
+from src.v2.crawler.parallel import run_in_pool
+from src.v2.crawler.watermarks import fingerprint, ingest_key, is_complete
 from datetime import datetime, timezone
+from typing import Any, Dict, List
 
 settings = Settings()
 fastf1.set_log_level("ERROR")
@@ -44,9 +51,44 @@ def circuit_id_by_event_name(db, event_name: str):
   circuit = db.query(CircuitModel).filter(CircuitModel.name == event_name).first()
   return circuit
 
-def get_sessions(db):
+def weather_records(weather_df: pd.DataFrame) -> List[Dict[str, Any]]:
+  """
+  JSON-ready records of a weather frame. Timedelta columns become their
+  string form ("0 days 00:01:02.345000"); the frame itself is not copied.
+  """
+  columns = {}
+  for name, column in weather_df.items():
+    if pd.api.types.is_timedelta64_dtype(column):
+      column = column.astype(str)
+    columns[name] = column.tolist()
+  names = list(columns)
+  return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+def load_session(session, mode: str) -> None:
+  if mode == "weather":
+    # Only weather_data is stored; skip laps, telemetry and race control messages
+    session.load(laps=False, telemetry=False, weather=True, messages=False)
+  else:
+    session.load()
+
+def fetch_weather(year: int, round_number: int, session_code: str, mode: str):
+  """
+  Load one session's weather with fastf1 and return `(weather, weather_summary)`
+  as plain values. Safe to run in a worker process.
+  """
+  session = fastf1.get_session(year, round_number, session_code)
+  load_session(session, mode)
+  weather_data = session.weather_data
+  # Convert weather data to a serializable format if it's a pandas DataFrame
+  if isinstance(weather_data, pd.DataFrame):
+      weather_data = weather_records(weather_data)
+  return weather_data, summarize_weather(weather_data)
+
+def plan_sessions(db):
+  """Session rows of the current season without weather, with the fastf1 code to load it from."""
   schedules = get_schedules()
   print(f"Total Events: {len(schedules)}")
+  planned = []
   
   for index, row in schedules.iterrows():
       circuit = circuit_id_by_event_name(db, row['EventName'])
@@ -60,23 +102,8 @@ def get_sessions(db):
         if session_time.tzinfo is None:
             session_time = session_time.replace(tzinfo=timezone.utc)
         
-        try:  
-          session = fastf1.get_session(settings.now.year, row['RoundNumber'], session_name_to_session_code[row[f"Session{i}"]])
-          session.load()
-          weather_data = session.weather_data
-          # Convert weather data to a serializable format if it's a pandas DataFrame
-          if hasattr(weather_data, 'to_dict'):
-              # Convert Timedelta and other non-serializable types to strings
-              weather_df = weather_data.copy()
-              for col in weather_df.select_dtypes(include=['timedelta64']).columns:
-                  weather_df[col] = weather_df[col].astype(str)
-              weather_data = weather_df.to_dict(orient='records')
-        except Exception as e:
-          session = None
-          weather_data = None
-          print(f"Error loading session {row['RoundNumber']} {session_name_to_session_code[row[f'Session{i}']]}: {str(e)}")
-          
         try:
+            session_code = session_name_to_session_code[row[f"Session{i}"]]
             session_data = {
                 "year": settings.now.year,
                 "round": int(row['RoundNumber']),
@@ -84,48 +111,115 @@ def get_sessions(db):
                 "session_name": row[f"Session{i}"],
                 "session_date": session_time,
                 "circuit_id": int(circuit.circuit_id),
-                "status": "Finished" if session_time < datetime.now(timezone.utc) else "Scheduled",
-                "weather": weather_data
+                "status": "Finished" if session_time < datetime.now(timezone.utc) else "Scheduled"
             }
         except Exception as e:
             print(f"Error creating session data for {row['EventName']} - {row[f'Session{i}']}: {str(e)}")
             continue
         
-        existing_session = db.query(SessionModel).filter(
-          SessionModel.year == session_data['year'],
-          SessionModel.round == session_data['round'],
-          SessionModel.session_type == session_data['session_type'],
-          SessionModel.session_name == session_data['session_name'],
-          SessionModel.session_date == session_data['session_date'],
-          SessionModel.circuit_id == session_data['circuit_id']
-        ).first()
-        
-        if existing_session:
-          # Update existing session
-          existing_session.updated_at = datetime.now(timezone.utc)
-          for key, value in session_data.items():
-            setattr(existing_session, key, value)
-          db.commit()
-          db.refresh(existing_session)
-          print(f"Updated session: Round{existing_session.round} - {existing_session.session_type} - {existing_session.session_name}")
-        else:
-          # Create new session
-          session_data['created_at'] = datetime.now(timezone.utc)
-          session_data['updated_at'] = datetime.now(timezone.utc)
-          new_session = SessionModel(**session_data)
-          db.add(new_session)
-          db.commit()
-          db.refresh(new_session)
-          print(f"Added new session: Round{new_session.round} - {new_session.session_type} - {new_session.session_name}")
+        planned.append((session_code, session_data))
+  
+  return planned
+
+def save_session(db, session_data: Dict[str, Any]) -> None:
+  existing_session = db.query(SessionModel).filter(
+    SessionModel.year == session_data['year'],
+    SessionModel.round == session_data['round'],
+    SessionModel.session_type == session_data['session_type'],
+    SessionModel.session_name == session_data['session_name'],
+    SessionModel.session_date == session_data['session_date'],
+    SessionModel.circuit_id == session_data['circuit_id']
+  ).first()
+  
+  if existing_session:
+    # Update existing session
+    existing_session.updated_at = datetime.now(timezone.utc)
+    for key, value in session_data.items():
+      setattr(existing_session, key, value)
+    db.commit()
+    db.refresh(existing_session)
+    print(f"Updated session: Round{existing_session.round} - {existing_session.session_type} - {existing_session.session_name}")
+  else:
+    # Create new session
+    session_data['created_at'] = datetime.now(timezone.utc)
+    session_data['updated_at'] = datetime.now(timezone.utc)
+    new_session = SessionModel(**session_data)
+    db.add(new_session)
+    db.commit()
+    db.refresh(new_session)
+    print(f"Added new session: Round{new_session.round} - {new_session.session_type} - {new_session.session_name}")
+
+def save_with_weather(db, session_code: str, session_data: Dict[str, Any], weather_data, weather_summary) -> None:
+  save_session(db, {**session_data, "weather": weather_data, "weather_summary": weather_summary})
+  if weather_data is not None:
+    # Only a session stored with its weather counts as ingested
+    key = ingest_key(session_data['year'], session_data['round'], session_code)
+    IngestStateRepository(db).mark("sessions", key, fingerprint(session_data))
+
+def get_sessions(db, mode: str = "weather", workers: int = 1, force: bool = False):
+  states = IngestStateRepository(db).get_states("sessions")
+  planned = []
+  skipped = 0
+  for session_code, session_data in plan_sessions(db):
+    key = ingest_key(session_data['year'], session_data['round'], session_code)
+    # Finished sessions with settled weather and an unchanged schedule entry are not reloaded
+    if not force and is_complete(states.get(key), session_data['session_date'], fingerprint(session_data)):
+      skipped += 1
+      continue
+    planned.append((session_code, session_data))
+  print(f"Sessions to ingest: {len(planned)}, already complete: {skipped}")
+  if not planned:
+    return
+  
+  if workers > 1:
+    # Workers load weather; this process writes every session row
+    jobs = [
+      (f"Round {session_data['round']} {session_code}", (session_data['year'], session_data['round'], session_code, mode))
+      for session_code, session_data in planned
+    ]
+    planned_by_key = {(session_data['round'], session_code): session_data for session_code, session_data in planned}
+    saved = set()
+    
+    def write(args, weather):
+      _, round_number, session_code, _ = args
+      save_with_weather(db, session_code, planned_by_key[(round_number, session_code)], *weather)
+      saved.add((round_number, session_code))
+    
+    run_in_pool(jobs, fetch_weather, workers, write)
+    # Sessions whose load failed are still stored, without weather
+    for key, session_data in planned_by_key.items():
+      if key not in saved:
+        save_with_weather(db, key[1], session_data, None, summarize_weather(None))
+  else:
+    for session_code, session_data in planned:
+      try:
+        weather_data, weather_summary = fetch_weather(session_data['year'], session_data['round'], session_code, mode)
+      except Exception as e:
+        weather_data, weather_summary = None, summarize_weather(None)
+        print(f"Error loading session {session_data['round']} {session_code}: {str(e)}")
+      save_with_weather(db, session_code, session_data, weather_data, weather_summary)
+  
+  # Invalidate cached API responses that depend on sessions
+  DataVersionRepository(db).bump("sessions")
           
 def init_db():
     """Initialize the database by creating all tables."""
-    from src.core.database.database import Base, engine
+    from src.core.database.database import engine
+    from src.core.database.schema import ensure_schema
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    ensure_schema(engine)
     print("Database tables created!")
 
 if __name__ == "__main__":    
+    parser = argparse.ArgumentParser(description="Ingest the sessions of the current season")
+    parser.add_argument("--mode", choices=["weather", "full"], default="weather",
+                        help="weather: load only the weather stream of each session (default); full: session.load() with every stream")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Load sessions in this many processes; sessions are still written by one process")
+    parser.add_argument("--force", action="store_true",
+                        help="Reload every session, including finished sessions that are already ingested")
+    args = parser.parse_args()
+    
     # Initialize the database first
     init_db()
     
@@ -133,7 +227,7 @@ if __name__ == "__main__":
     db = SessionLocal()
     
     try:
-      get_sessions(db)
+      get_sessions(db, args.mode, args.workers, args.force)
     except Exception as e:
         print(f"Error getting schedules: {str(e)}")
         db.rollback()
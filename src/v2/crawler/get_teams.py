@@ -2,6 +2,7 @@ from ..utils.load_json import load_json
 from pathlib import Path
 from src.core.database.database import SessionLocal
 from src.v2.models.team import Team
+from src.v2.repositories.data_versions import DataVersionRepository
 
 def get_teams(session, teams_data):
   for team_data in teams_data:
@@ -34,6 +35,7 @@ if __name__ == "__main__":
     teams_data = load_json(base_path / 'data' / 'F1Teams.json')
     get_teams(session, teams_data)
     session.commit()
+    DataVersionRepository(session).bump("teams")
     print(f"Processed {len(teams_data)} teams.")
   except Exception as e:
     print(f"An error occurred: {str(e)}")
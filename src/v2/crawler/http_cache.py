@@ -0,0 +1,210 @@
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
+
+import requests
+
+from src.core.config import Settings
+
+if TYPE_CHECKING:
+  import aiohttp
+
+settings = Settings()
+
+T = TypeVar("T")
+
+DAY = 24 * 60 * 60
+
+# Seconds a stored response is used without contacting the server, by URL
+# prefix (longest match wins). Past that it is revalidated with
+# If-None-Match / If-Modified-Since; unlisted URLs are always revalidated.
+FRESHNESS_RULES: Dict[str, float] = {
+  "https://flagsapi.com/": 30 * DAY,
+  "https://api.multiviewer.app/": DAY,
+  "https://www.formula1.com/en/racing/": DAY,
+  "https://www.formula1.com/en/latest": 0,
+  "https://www.formula1.com/en/latest/article/": DAY,
+}
+
+@dataclass
+class CachedResponse:
+  """The parts of a response the crawlers read, from the network or from disk."""
+  url: str
+  status_code: int
+  content: bytes
+  from_cache: bool = False  # body served from disk: still fresh, or answered 304
+
+  @property
+  def text(self) -> str:
+    return self.content.decode("utf-8", errors="replace")
+
+  def json(self) -> Any:
+    return json.loads(self.content)
+
+  def raise_for_status(self) -> None:
+    if self.status_code >= 400:
+      raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+@dataclass
+class CacheStats:
+  requests: int = 0
+  fresh: int = 0  # served from disk without a request
+  not_modified: int = 0  # revalidated with a 304
+  downloaded: int = 0
+  parsed: int = 0  # parse results reused instead of parsing the page again
+  bytes_downloaded: int = 0
+  bytes_saved: int = 0
+
+class HttpCache:
+  """
+  On-disk HTTP cache shared by the crawlers, keyed by URL. Each entry keeps
+  the body, its validators (ETag, Last-Modified) and the results of the
+  parsers that ran on it, so an unchanged page costs at most one 304 and
+  no parsing. Only 200 responses are stored.
+  """
+  def __init__(self, directory: str = settings.HTTP_CACHE_DIR, rules: Dict[str, float] = FRESHNESS_RULES, enabled: bool = settings.HTTP_CACHE_ENABLED):
+    self.directory = Path(directory)
+    self.rules = rules
+    self.enabled = enabled
+    self.stats = CacheStats()
+
+  def freshness(self, url: str) -> float:
+    matches = [prefix for prefix in self.rules if url.startswith(prefix)]
+    return self.rules[max(matches, key=len)] if matches else 0
+
+  def _path(self, url: str, suffix: str) -> Path:
+    return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}{suffix}"
+
+  def _write(self, path: Path, data: bytes) -> None:
+    # Write then rename, so a crash never leaves a truncated entry behind. The
+    # temporary name is unique per call: parsers also write from worker threads
+    self.directory.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=self.directory, prefix=f"{path.name}.", suffix=".tmp", delete=False) as temporary:
+      temporary.write(data)
+    try:
+      os.replace(temporary.name, path)
+    except OSError:
+      os.unlink(temporary.name)
+      raise
+
+  def _load(self, url: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+    try:
+      meta = json.loads(self._path(url, ".json").read_bytes())
+      return meta, self._path(url, ".body").read_bytes()
+    except (OSError, ValueError):
+      return None
+
+  def _lookup(self, url: str, headers: Optional[Dict[str, str]]) -> Tuple[Optional[Tuple[Dict[str, Any], bytes]], Dict[str, str]]:
+    """The stored entry and the request headers, with validators added when the entry is stale."""
+    self.stats.requests += 1
+    headers = dict(headers or {})
+    entry = self._load(url) if self.enabled else None
+    if entry:
+      meta, _ = entry
+      if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+      if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return entry, headers
+
+  def _fresh(self, url: str, entry: Optional[Tuple[Dict[str, Any], bytes]]) -> Optional[CachedResponse]:
+    if not entry or time.time() - entry[0]["fetched_at"] >= self.freshness(url):
+      return None
+    self.stats.fresh += 1
+    self.stats.bytes_saved += len(entry[1])
+    return CachedResponse(url, 200, entry[1], from_cache=True)
+
+  def _finish(self, url: str, entry, status: int, response_headers, content: bytes) -> CachedResponse:
+    if status == 304 and entry:
+      meta, body = entry
+      meta["fetched_at"] = time.time()
+      meta["etag"] = response_headers.get("ETag") or meta.get("etag")
+      meta["last_modified"] = response_headers.get("Last-Modified") or meta.get("last_modified")
+      self._write(self._path(url, ".json"), json.dumps(meta).encode())
+      self.stats.not_modified += 1
+      self.stats.bytes_saved += len(body)
+      return CachedResponse(url, 200, body, from_cache=True)
+
+    self.stats.downloaded += 1
+    self.stats.bytes_downloaded += len(content)
+    if status == 200 and self.enabled:
+      for parsed in self.directory.glob(self._path(url, ".*.pickle").name):
+        parsed.unlink(missing_ok=True)
+      self._write(self._path(url, ".body"), content)
+      self._write(self._path(url, ".json"), json.dumps({
+        "url": url,
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+        "fetched_at": time.time()
+      }).encode())
+    return CachedResponse(url, status, content)
+
+  def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+    """GET through the cache with requests."""
+    entry, request_headers = self._lookup(url, headers)
+    cached = self._fresh(url, entry)
+    if cached:
+      return cached
+    response = requests.get(url, headers=request_headers)
+    return self._finish(url, entry, response.status_code, response.headers, response.content)
+
+  async def fetch_async(self, session: "aiohttp.ClientSession", url: str, headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+    """GET through the cache on an aiohttp session."""
+    entry, request_headers = self._lookup(url, headers)
+    cached = self._fresh(url, entry)
+    if cached:
+      return cached
+    async with session.get(url, headers=request_headers) as response:
+      content = await response.read()
+      return self._finish(url, entry, response.status, response.headers, content)
+
+  def _parse(self, response: CachedResponse, parse: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[T, bool]:
+    """The parse result and whether it was reused. Safe to run in a worker thread: it leaves `stats` alone."""
+    key = hashlib.sha1(repr((parse.__module__, parse.__qualname__, args)).encode()).hexdigest()[:16]
+    path = self._path(response.url, f".{key}.pickle")
+    if self.enabled and response.from_cache:
+      try:
+        return pickle.loads(path.read_bytes()), True
+      except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    value = parse(response.content, *args)
+    if self.enabled and response.status_code == 200:
+      self._write(path, pickle.dumps(value))
+    return value, False
+
+  def parsed(self, response: CachedResponse, parse: Callable[..., T], *args: Any) -> T:
+    """
+    `parse(response.content, *args)`, reusing the stored result while the
+    body is unchanged. Results are keyed by the parser's name and `args`,
+    so clear the cache directory after changing what a parser returns.
+    """
+    value, reused = self._parse(response, parse, args)
+    if reused:
+      self.stats.parsed += 1
+    return value
+
+  async def parsed_async(self, response: CachedResponse, parse: Callable[..., T], *args: Any) -> T:
+    """`parsed` in a worker thread, so other downloads keep going; counted on the event loop."""
+    value, reused = await asyncio.to_thread(self._parse, response, parse, args)
+    if reused:
+      self.stats.parsed += 1
+    return value
+
+  def report(self) -> None:
+    stats = self.stats
+    total = stats.bytes_downloaded + stats.bytes_saved
+    print(
+      f"HTTP cache: {stats.requests} requests, {stats.fresh} fresh, {stats.not_modified} not modified, "
+      f"{stats.downloaded} downloaded, {stats.parsed} parses skipped; "
+      f"saved {stats.bytes_saved / 1024:,.0f} of {total / 1024:,.0f} KiB"
+    )
+
+# Shared by the crawlers of one run; each reports its counters when it finishes
+http_cache = HttpCache()
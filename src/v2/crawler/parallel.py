@@ -0,0 +1,44 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, List, Sequence, Tuple
+
+def run_in_pool(
+  jobs: Sequence[Tuple[str, tuple]],
+  worker: Callable[..., Any],
+  workers: int,
+  write: Callable[[tuple, Any], None]
+) -> List[Tuple[str, str]]:
+  """
+  Run `worker(*args)` for every `(label, args)` job in a pool of worker
+  processes and pass each result to `write(args, result)` in this process,
+  in completion order, so database writes stay serialized.
+
+  Workers must only load and transform data and return plain, picklable
+  rows; they never touch the database. A failing job is reported and
+  skipped; an error raised by `write` stops the run.
+
+  Returns the `(label, error)` pairs of the failed jobs.
+  """
+  failures = []
+  total = len(jobs)
+  # spawn, so workers do not inherit the parent's pooled database connections
+  executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+  try:
+    futures = {executor.submit(worker, *args): (label, args) for label, args in jobs}
+    for done, future in enumerate(as_completed(futures), 1):
+      label, args = futures[future]
+      try:
+        result = future.result()
+      except Exception as e:
+        failures.append((label, str(e)))
+        print(f"[{done}/{total}] ❌ {label}: {str(e)}")
+        continue
+      write(args, result)
+      print(f"[{done}/{total}] ✅ {label}")
+  finally:
+    executor.shutdown(wait=True, cancel_futures=True)
+
+  print(f"Completed {total - len(failures)}/{total} sessions")
+  for label, error in failures:
+    print(f"  - failed: {label}: {error}")
+  return failures
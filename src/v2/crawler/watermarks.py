@@ -0,0 +1,42 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import orjson
+
+from src.core.config import Settings
+from src.v2.models.ingest_state import IngestState as IngestStateModel
+
+settings = Settings()
+
+def ingest_key(year: int, round: int, session_code: str) -> str:
+  """Key of a session in the ingest_state table, e.g. "2025-03-FP1"."""
+  return f"{int(year)}-{int(round):02d}-{session_code}"
+
+def fingerprint(value: Any) -> str:
+  """sha256 of the rows a crawler is about to write; key order does not matter."""
+  return hashlib.sha256(orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)).hexdigest()
+
+def as_utc(value) -> Optional[datetime]:
+  """Aware UTC datetime from a datetime or pandas Timestamp; naive values are taken as UTC."""
+  if value is None or value != value:  # None or NaT
+    return None
+  if hasattr(value, "to_pydatetime"):
+    value = value.to_pydatetime()
+  if value.tzinfo is None:
+    return value.replace(tzinfo=timezone.utc)
+  return value.astimezone(timezone.utc)
+
+def is_complete(state: Optional[IngestStateModel], session_date, digest: Optional[str] = None) -> bool:
+  """
+  Whether a session can be skipped: it was ingested at least
+  INGEST_SETTLE_HOURS after it started, so late classification changes are
+  in, and `digest` (when given) still matches what was ingested.
+  """
+  session_date = as_utc(session_date)
+  if state is None or session_date is None:
+    return False
+  settled_at = session_date + timedelta(hours=settings.INGEST_SETTLE_HOURS)
+  if as_utc(state.last_ingested_at) < settled_at:
+    return False
+  return digest is None or state.fingerprint == digest
@@ -1,6 +1,15 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import date
+from typing import Iterable, List, Sequence
 from src.v2.models.driver import Driver
+from src.v2.models.standing import DriverStanding
+
+# Column order expected by DriverDto.from_rows: drivers outer-joined to driver_standings
+DRIVER_COLUMNS = (
+    Driver.id, Driver.permanentNumber, Driver.familyName, Driver.givenName, Driver.nameAcronym,
+    Driver.dateOfBirth, Driver.nationality, Driver.headshotURL, Driver.countryFlagURL, Driver.currentTeam,
+    DriverStanding.points, DriverStanding.podiums, DriverStanding.wins
+)
 
 class DriverStats(BaseModel):
     points: int = 0
@@ -46,4 +55,20 @@ class DriverDto(BaseModel):
             country_flag_url=driver.countryFlagURL,
             team=driver.currentTeam,
             stats=DriverStats(points=points, podiums=podiums, wins=wins)
-        )
\ No newline at end of file
+        )
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> List['DriverDto']:
+        """Bulk `from_model` for rows selected with DRIVER_COLUMNS, validated in one pass."""
+        return _DRIVER_LIST.validate_python([
+            {
+                'id': id, 'driver_number': driver_number, 'family_name': family_name,
+                'given_name': given_name, 'name_acronym': name_acronym, 'date_of_birth': date_of_birth,
+                'nationality': nationality, 'headshot_url': headshot_url, 'country_flag_url': country_flag_url,
+                'team': team, 'stats': {'points': points or 0, 'podiums': podiums or 0, 'wins': wins or 0}
+            }
+            for (id, driver_number, family_name, given_name, name_acronym, date_of_birth, nationality,
+                 headshot_url, country_flag_url, team, points, podiums, wins) in rows
+        ])
+
+_DRIVER_LIST = TypeAdapter(List[DriverDto])
\ No newline at end of file
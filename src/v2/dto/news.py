@@ -1,19 +1,41 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
+from typing import Iterable, List, Sequence
 from src.v2.models.news import News as NewsModel
 
-class NewsDto(BaseModel):
+# Column order expected by NewsSummaryDto.from_rows; everything but content
+NEWS_SUMMARY_COLUMNS = (
+  NewsModel.id, NewsModel.display_title, NewsModel.title, NewsModel.description, NewsModel.thumbnail,
+  NewsModel.url, NewsModel.published_at, NewsModel.created_at, NewsModel.updated_at
+)
+
+class NewsSummaryDto(BaseModel):
+  """News list item; the article body is only served by the detail route."""
   id: int | None = None
   display_title: str | None = None
   title: str | None = None
   summary: str | None = None
-  content: str | None = None
   thumbnail: str | None = None
   url: str | None = None
   published_at: datetime | None = None
   created_at: datetime | None = None
   updated_at: datetime | None = None
   
+  @classmethod
+  def from_rows(cls, rows: Iterable[Sequence]) -> List["NewsSummaryDto"]:
+    """List items for rows selected with NEWS_SUMMARY_COLUMNS, validated in one pass."""
+    return _NEWS_SUMMARY_LIST.validate_python([
+      {
+        'id': id, 'display_title': display_title, 'title': title, 'summary': description,
+        'thumbnail': thumbnail, 'url': url, 'published_at': published_at,
+        'created_at': created_at, 'updated_at': updated_at
+      }
+      for id, display_title, title, description, thumbnail, url, published_at, created_at, updated_at in rows
+    ])
+
+class NewsDto(NewsSummaryDto):
+  content: str | None = None
+  
   @classmethod
   def from_model(cls, model: NewsModel) -> "NewsDto":
     return cls(
@@ -27,4 +49,6 @@ class NewsDto(BaseModel):
       published_at=model.published_at,
       created_at=model.created_at,
       updated_at=model.updated_at
-    )
\ No newline at end of file
+    )
+
+_NEWS_SUMMARY_LIST = TypeAdapter(List[NewsSummaryDto])
@@ -1,7 +1,15 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
+from typing import Iterable, List, Sequence
 from src.v2.models.result import Result as ResultModel
 
+# Column order expected by ResultDto.from_rows
+RESULT_COLUMNS = (
+  ResultModel.id, ResultModel.session_id, ResultModel.driver_number, ResultModel.position,
+  ResultModel.points, ResultModel.status, ResultModel.laps_completed, ResultModel.Q1,
+  ResultModel.Q2, ResultModel.Q3, ResultModel.time, ResultModel.created_at, ResultModel.updated_at
+)
+
 class ResultDto(BaseModel):
   id: int | None = None
   session_id: int | None = None
@@ -64,4 +72,24 @@ class ResultDto(BaseModel):
       time=cls._parse_time_value(result.time),
       created_at=result.created_at,
       updated_at=result.updated_at
-    )
\ No newline at end of file
+    )
+  
+  @classmethod
+  def from_rows(cls, rows: Iterable[Sequence]) -> List['ResultDto']:
+    """
+    Bulk `from_model` for rows selected with RESULT_COLUMNS. The columns are
+    already typed by the ORM, so the whole list is validated in one pass
+    instead of parsing and validating row by row.
+    """
+    return _RESULT_LIST.validate_python([
+      {
+        'id': id, 'session_id': session_id, 'driver_number': driver_number,
+        'position': None if position is None else int(position), 'points': points,
+        'status': status, 'laps_completed': laps_completed or 0,
+        'Q1': q1, 'Q2': q2, 'Q3': q3, 'time': time,
+        'created_at': created_at, 'updated_at': updated_at
+      }
+      for id, session_id, driver_number, position, points, status, laps_completed, q1, q2, q3, time, created_at, updated_at in rows
+    ])
+
+_RESULT_LIST = TypeAdapter(List[ResultDto])
\ No newline at end of file
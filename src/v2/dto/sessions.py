@@ -1,10 +1,16 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, List, Union
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Collection, Iterable, Optional, Dict, List, Sequence, Union
 from datetime import datetime
-import numpy as np
 from src.v2.models.session import Session as SessionModel
 from src.v2.dto.results import ResultDto
-from src.v2.utils.analyze_weather import analyze_weather_conditions
+from src.v2.utils.analyze_weather import summarize_weather
+
+# Columns that can be requested with `fields=` and embeds that can be requested with `include=`
+SESSION_FIELDS = (
+    'id', 'year', 'round', 'session_type', 'session_name', 'session_date',
+    'circuit_id', 'status', 'created_at', 'updated_at'
+)
+SESSION_INCLUDES = ('results', 'weather')
 
 class WeatherData(BaseModel):
     weather_condition: str
@@ -29,22 +35,13 @@ class SessionDto(BaseModel):
     
     class Config:
         orm_mode = True
-        json_encoders = {
-            np.float64: float  # Ensure numpy types are properly serialized
-        }
         
     @classmethod
-    def from_model(cls, session: SessionModel) -> 'SessionDto':
-        # Get representative weather data if available
-        weather = None
-        if session.weather and isinstance(session.weather, list):
-            weather_data = analyze_weather_conditions(session.weather)
-            weather = WeatherData(**weather_data)
-        elif session.weather and isinstance(session.weather, dict):
-            # Handle case where weather is a single data point
-            weather_data = analyze_weather_conditions([session.weather])
-            weather = WeatherData(**weather_data)
-            
+    def from_model(cls, session: SessionModel, results: Optional[List[ResultDto]] = None) -> 'SessionDto':
+        """
+        Build a SessionDto. Pass preloaded `results` to avoid the per-session
+        query issued by the dynamic `session.results` relationship.
+        """
         return cls(
             id=session.id,
             year=session.year,
@@ -54,8 +51,84 @@ class SessionDto(BaseModel):
             session_date=session.session_date,
             circuit_id=session.circuit_id,
             status=session.status,
-            weather=weather,
+            weather=cls.weather_from_model(session),
             created_at=session.created_at,
             updated_at=session.updated_at,
-            results=[ResultDto.from_model(result) for result in (session.results or [])]
+            results=cls._results(session, results)
         )
+    
+    @classmethod
+    def from_models(cls, sessions: Iterable[SessionModel], results_by_session: Dict[int, List[ResultDto]]) -> List['SessionDto']:
+        """Bulk `from_model` over preloaded results, validated in one pass."""
+        return _SESSION_LIST.validate_python([
+            {
+                'id': session.id,
+                'year': session.year,
+                'round': session.round,
+                'session_type': session.session_type,
+                'session_name': session.session_name,
+                'session_date': session.session_date,
+                'circuit_id': session.circuit_id,
+                'status': session.status,
+                'weather': cls.weather_from_model(session),
+                'created_at': session.created_at,
+                'updated_at': session.updated_at,
+                'results': results_by_session.get(session.id, [])
+            }
+            for session in sessions
+        ])
+    
+    @staticmethod
+    def _results(session: SessionModel, results: Optional[List[ResultDto]]) -> List[ResultDto]:
+        if results is not None:
+            return results
+        return [ResultDto.from_model(result) for result in session.results]
+    
+    @staticmethod
+    def weather_from_model(session: SessionModel) -> Optional[WeatherData]:
+        # The summary is computed at ingest; rows not yet backfilled fall back to the raw samples
+        weather_data = session.weather_summary
+        if weather_data is None:
+            weather_data = summarize_weather(session.weather)
+        return WeatherData(**weather_data) if weather_data else None
+    
+    @classmethod
+    def sparse_from_model(
+        cls,
+        session: SessionModel,
+        fields: Sequence[str],
+        include: Collection[str],
+        results: Optional[List[ResultDto]] = None
+    ) -> Dict[str, Any]:
+        """
+        Only the requested columns and embeds, for `fields=` / `include=` requests.
+        Embeds that are not requested are neither loaded nor computed.
+        """
+        data = {field: getattr(session, field) for field in fields}
+        if 'weather' in include:
+            data['weather'] = cls.weather_from_model(session)
+        if 'results' in include:
+            data['results'] = cls._results(session, results)
+        return data
+    
+    @classmethod
+    def sparse_from_models(
+        cls,
+        sessions: Iterable[SessionModel],
+        fields: Sequence[str],
+        include: Collection[str],
+        results_by_session: Optional[Dict[int, List[ResultDto]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk `sparse_from_model`. With preloaded `results_by_session`, sessions
+        missing from it get an empty list and `session.results` is never
+        queried; without it each session loads its own results.
+        """
+        if results_by_session is None:
+            return [cls.sparse_from_model(session, fields, include) for session in sessions]
+        return [
+            cls.sparse_from_model(session, fields, include, results=results_by_session.get(session.id, []))
+            for session in sessions
+        ]
+
+_SESSION_LIST = TypeAdapter(List[SessionDto])
@@ -0,0 +1,41 @@
+from pydantic import BaseModel
+from datetime import datetime
+from src.v2.models.standing import DriverStanding as DriverStandingModel, TeamStanding as TeamStandingModel
+
+class DriverStandingDto(BaseModel):
+  position: int
+  driver_number: int
+  points: float
+  wins: int
+  podiums: int
+  updated_at: datetime | None = None
+  
+  @classmethod
+  def from_model(cls, standing: DriverStandingModel) -> 'DriverStandingDto':
+    return cls(
+      position=standing.position,
+      driver_number=standing.driver_number,
+      points=standing.points or 0.0,
+      wins=standing.wins or 0,
+      podiums=standing.podiums or 0,
+      updated_at=standing.updated_at
+    )
+
+class TeamStandingDto(BaseModel):
+  position: int
+  constructor_id: str
+  points: float
+  wins: int
+  podiums: int
+  updated_at: datetime | None = None
+  
+  @classmethod
+  def from_model(cls, standing: TeamStandingModel) -> 'TeamStandingDto':
+    return cls(
+      position=standing.position,
+      constructor_id=standing.constructor_id,
+      points=standing.points or 0.0,
+      wins=standing.wins or 0,
+      podiums=standing.podiums or 0,
+      updated_at=standing.updated_at
+    )
@@ -9,6 +9,9 @@ from .driver import Driver
 from .team import Team
 from .result import Result
 from .news import News
+from .standing import DriverStanding, TeamStanding
+from .data_version import DataVersion
+from .ingest_state import IngestState
 
 # This ensures that all models are properly imported and their metadata is available
-__all__ = ['Circuit', 'Session', 'Driver', 'Team', 'Result', 'News']
+__all__ = ['Circuit', 'Session', 'Driver', 'Team', 'Result', 'News', 'DriverStanding', 'TeamStanding', 'DataVersion', 'IngestState']
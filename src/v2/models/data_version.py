@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, DateTime
+
+from src.core.database.base import Base
+
+class DataVersion(Base):
+    """
+    Version counter per data set, bumped by the crawlers after they commit.
+    The API uses it to invalidate cached responses.
+    """
+    __tablename__ = "data_versions"
+    __table_args__ = {'extend_existing': True}
+    
+    name = Column(String(50), primary_key=True, comment="e.g., sessions, results, news")
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "version": self.version,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+    
+    def __repr__(self):
+        return f"<DataVersion(name={self.name}, version={self.version})>"
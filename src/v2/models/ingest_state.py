@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, DateTime
+
+from src.core.database.base import Base
+
+class IngestState(Base):
+    """
+    Last ingest of one session by one crawler. The crawlers skip finished
+    sessions whose state is settled, and rows whose fingerprint is unchanged.
+    """
+    __tablename__ = "ingest_state"
+    __table_args__ = {'extend_existing': True}
+    
+    crawler = Column(String(50), primary_key=True, comment="e.g., sessions, results")
+    session_key = Column(String(100), primary_key=True, comment="e.g., 2025-03-FP1")
+    fingerprint = Column(String(64), nullable=False, comment="sha256 of the ingested rows")
+    last_ingested_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    
+    def to_dict(self):
+        return {
+            "crawler": self.crawler,
+            "session_key": self.session_key,
+            "fingerprint": self.fingerprint,
+            "last_ingested_at": self.last_ingested_at.isoformat() if self.last_ingested_at else None
+        }
+    
+    def __repr__(self):
+        return f"<IngestState(crawler={self.crawler}, session_key={self.session_key})>"
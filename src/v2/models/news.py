@@ -1,10 +1,16 @@
 from src.core.database.base import Base
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from datetime import datetime, timezone
 
 class News(Base):
     __tablename__ = "news"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Keyset pagination order for the latest news list
+        Index('ix_news_published_at_id', 'published_at', 'id'),
+        # One row per article; conflict target of the upsert in get_news
+        Index('uq_news_url', 'url', unique=True),
+        {'extend_existing': True}
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -15,6 +21,7 @@ class News(Base):
     thumbnail = Column(Text, nullable=False)
     url = Column(Text, nullable=False)
     published_at = Column(DateTime, nullable=False)
+    content_hash = Column(String(64), nullable=True, comment="sha256 of the article fields, rows are rewritten only when it changes")
     
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc))
@@ -29,6 +36,7 @@ class News(Base):
             "thumbnail": self.thumbnail,
             "url": self.url,
             "published_at": self.published_at.isoformat() if self.published_at else None,
+            "content_hash": self.content_hash,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
@@ -1,11 +1,17 @@
 from src.core.database.base import Base
-from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, String
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, String, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
 class Result(Base):
     __tablename__ = "results"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Keyset pagination of a driver's results
+        Index('ix_results_driver_number_id', 'driver_number', 'id'),
+        # One result per driver per session; conflict target of the bulk upsert in get_results
+        Index('uq_results_session_id_driver_number', 'session_id', 'driver_number', unique=True),
+        {'extend_existing': True}
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -15,6 +21,9 @@ class Result(Base):
     driver_number = Column(Integer, ForeignKey("drivers.permanentNumber"), nullable=False)
     driver = relationship("Driver", back_populates="results")
     
+    # Team the driver raced for in this session, so constructor standings survive driver swaps
+    constructor_id = Column(String, ForeignKey("teams.constructorId"), nullable=True)
+    
     position = Column(Float, nullable=True)
     points = Column(Float, default=0.0)
     
@@ -35,6 +44,7 @@ class Result(Base):
             "id": self.id,
             "session_id": self.session_id,
             "driver_number": self.driver_number,
+            "constructor_id": self.constructor_id,
             "position": self.position,
             "points": self.points,
             "status": self.status,
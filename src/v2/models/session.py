@@ -1,14 +1,18 @@
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Float, Index
+from sqlalchemy.orm import relationship, deferred
 import json
 
 from src.core.database.base import Base
 
 class Session(Base):
     __tablename__ = "sessions"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Keyset pagination order for the session list
+        Index('ix_sessions_session_date_id', 'session_date', 'id'),
+        {'extend_existing': True}
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     year = Column(Integer, nullable=False, index=True)
@@ -21,7 +25,10 @@ class Session(Base):
     status = Column(String(50), default='Scheduled', comment="e.g., Scheduled, In Progress, Completed, Cancelled")
     
     # Weather data (can be stored as JSON for flexibility)
-    weather = Column(JSON, nullable=True, comment="Weather conditions during the session")
+    # Raw samples are large and only read at ingest/backfill, so they are deferred
+    weather = deferred(Column(JSON, nullable=True, comment="Weather conditions during the session"))
+    # WeatherData summary computed once at ingest from the raw samples
+    weather_summary = Column(JSON(none_as_null=True), nullable=True, comment="Precomputed weather summary")
     
     # Relationships
     circuit = relationship("Circuit", back_populates="sessions")
@@ -47,6 +54,7 @@ class Session(Base):
             "circuit_id": self.circuit_id,
             "status": self.status,
             "weather": json.loads(self.weather) if isinstance(self.weather, str) else self.weather,
+            "weather_summary": self.weather_summary,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
\ No newline at end of file
@@ -0,0 +1,60 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime
+
+from src.core.database.base import Base
+
+class DriverStanding(Base):
+    """
+    Materialized driver standings, recomputed by the results crawler.
+    """
+    __tablename__ = "driver_standings"
+    __table_args__ = {'extend_existing': True}
+    
+    driver_number = Column(Integer, ForeignKey("drivers.permanentNumber"), primary_key=True)
+    position = Column(Integer, nullable=False)
+    points = Column(Float, default=0.0)
+    wins = Column(Integer, default=0)
+    podiums = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    
+    def to_dict(self):
+        return {
+            "driver_number": self.driver_number,
+            "position": self.position,
+            "points": self.points,
+            "wins": self.wins,
+            "podiums": self.podiums,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+    
+    def __repr__(self):
+        return f"<DriverStanding(driver_number={self.driver_number}, position={self.position}, points={self.points})>"
+
+class TeamStanding(Base):
+    """
+    Materialized constructor standings, recomputed by the results crawler.
+    """
+    __tablename__ = "team_standings"
+    __table_args__ = {'extend_existing': True}
+    
+    constructor_id = Column(String, ForeignKey("teams.constructorId"), primary_key=True)
+    position = Column(Integer, nullable=False)
+    points = Column(Float, default=0.0)
+    wins = Column(Integer, default=0)
+    podiums = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    
+    def to_dict(self):
+        return {
+            "constructor_id": self.constructor_id,
+            "position": self.position,
+            "points": self.points,
+            "wins": self.wins,
+            "podiums": self.podiums,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+    
+    def __repr__(self):
+        return f"<TeamStanding(constructor_id={self.constructor_id}, position={self.position}, points={self.points})>"
@@ -1,4 +1,5 @@
 from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.v2.models.circuit import Circuit as CircuitModel
 from src.v2.dto.circuits import CircuitDto
@@ -14,4 +15,14 @@ class CircuitRepository:
     def get_circuit_by_circuit_id(self, circuit_id: int) -> CircuitDto:
         circuit = self.db.query(CircuitModel).filter(CircuitModel.circuit_id == circuit_id).first()
         return CircuitDto.from_model(circuit)
-        
\ No newline at end of file
+
+class AsyncCircuitRepository:
+    """CircuitRepository on an AsyncSession; queries run through the async driver."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_circuits(self) -> List[CircuitDto]:
+        return await self.db.run_sync(lambda db: CircuitRepository(db).get_circuits())
+    
+    async def get_circuit_by_circuit_id(self, circuit_id: int) -> CircuitDto:
+        return await self.db.run_sync(lambda db: CircuitRepository(db).get_circuit_by_circuit_id(circuit_id))
@@ -0,0 +1,36 @@
+from typing import Dict
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.v2.models.data_version import DataVersion as DataVersionModel
+
+class DataVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_versions(self) -> Dict[str, int]:
+        rows = self.db.query(DataVersionModel.name, DataVersionModel.version).all()
+        return {name: version for name, version in rows}
+    
+    def bump(self, *names: str) -> None:
+        """Increment the version of each data set. Call after the data itself is committed."""
+        existing = {
+            version.name: version
+            for version in self.db.query(DataVersionModel).filter(DataVersionModel.name.in_(names)).all()
+        }
+        now = datetime.now(timezone.utc)
+        for name in names:
+            if name in existing:
+                existing[name].version = DataVersionModel.version + 1
+                existing[name].updated_at = now
+            else:
+                self.db.add(DataVersionModel(name=name, version=1, updated_at=now))
+        self.db.commit()
+
+class AsyncDataVersionRepository:
+    """DataVersionRepository on an AsyncSession; queries run through the async driver."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_versions(self) -> Dict[str, int]:
+        return await self.db.run_sync(lambda db: DataVersionRepository(db).get_versions())
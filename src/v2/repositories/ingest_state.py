@@ -0,0 +1,24 @@
+from typing import Dict
+from datetime import datetime, timezone
+from sqlalchemy.orm import Session
+from src.v2.models.ingest_state import IngestState as IngestStateModel
+
+class IngestStateRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_states(self, crawler: str) -> Dict[str, IngestStateModel]:
+        """Every recorded session of a crawler keyed by session_key, loaded with one query."""
+        states = self.db.query(IngestStateModel).filter(IngestStateModel.crawler == crawler).all()
+        return {state.session_key: state for state in states}
+    
+    def mark(self, crawler: str, session_key: str, fingerprint: str) -> IngestStateModel:
+        """Record a complete ingest of a session. Call after its rows are committed."""
+        state = self.db.merge(IngestStateModel(
+            crawler=crawler,
+            session_key=session_key,
+            fingerprint=fingerprint,
+            last_ingested_at=datetime.now(timezone.utc)
+        ))
+        self.db.commit()
+        return state
@@ -1,15 +1,55 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.v2.models.news import News as NewsModel
-from src.v2.dto.news import NewsDto
+from src.v2.dto.news import NewsDto, NewsSummaryDto, NEWS_SUMMARY_COLUMNS
+from src.v2.utils.pagination import Page, paginate
 
 class NewsRepository:
   def __init__(self, db: Session):
     self.db = db
     
-  def get_latest_news(self, limit: int = 10) -> List[NewsDto]:
-    news = self.db.query(NewsModel)\
+  def get_latest_news(self, limit: int = 10) -> List[NewsSummaryDto]:
+    rows = self.db.query(*NEWS_SUMMARY_COLUMNS)\
                  .order_by(NewsModel.published_at.desc())\
                  .limit(limit)\
                  .all()
-    return [NewsDto.from_model(news) for news in news]
\ No newline at end of file
+    return NewsSummaryDto.from_rows(rows)
+  
+  def get_news_page(self, limit: int = 10, after: Optional[Tuple[datetime, int]] = None) -> Page[NewsSummaryDto]:
+    """
+    Newest first, continuing after the `(published_at, id)` key of the
+    previous page. Only the summary columns are read, never `content`.
+    """
+    query = self.db.query(*NEWS_SUMMARY_COLUMNS)
+    if after:
+      published_at, news_id = after
+      query = query.filter(or_(
+        NewsModel.published_at < published_at,
+        and_(NewsModel.published_at == published_at, NewsModel.id < news_id)
+      ))
+    rows = query.order_by(NewsModel.published_at.desc(), NewsModel.id.desc())\
+                .limit(limit + 1)\
+                .all()
+    rows, next_key = paginate(rows, limit, lambda row: (row.published_at, row.id))
+    return Page(NewsSummaryDto.from_rows(rows), next_key)
+  
+  def get_news_by_id(self, news_id: int) -> Optional[NewsDto]:
+    news = self.db.query(NewsModel).filter(NewsModel.id == news_id).first()
+    return NewsDto.from_model(news) if news else None
+
+class AsyncNewsRepository:
+  """NewsRepository on an AsyncSession; queries run through the async driver."""
+  def __init__(self, db: AsyncSession):
+    self.db = db
+  
+  async def get_latest_news(self, limit: int = 10) -> List[NewsSummaryDto]:
+    return await self.db.run_sync(lambda db: NewsRepository(db).get_latest_news(limit))
+  
+  async def get_news_page(self, limit: int = 10, after: Optional[Tuple[datetime, int]] = None) -> Page[NewsSummaryDto]:
+    return await self.db.run_sync(lambda db: NewsRepository(db).get_news_page(limit, after))
+  
+  async def get_news_by_id(self, news_id: int) -> Optional[NewsDto]:
+    return await self.db.run_sync(lambda db: NewsRepository(db).get_news_by_id(news_id))
@@ -0,0 +1,133 @@
+import re
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.v2.models.news import News as NewsModel
+from src.v2.dto.news import NewsSummaryDto, NEWS_SUMMARY_COLUMNS
+from src.v2.utils.pagination import Page, paginate
+
+# Title, description and content weights of the SQLite bm25 ranking
+FTS5_WEIGHTS = "10.0, 4.0, 1.0"
+
+# Same weighting on PostgreSQL through tsvector labels (A > B > C)
+POSTGRES_VECTOR = (
+  "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+  "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+  "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+def ensure_news_search(engine: Engine) -> None:
+  """
+  Create the full-text index over news title, description and content and
+  fill it from the stored rows: an FTS5 external-content table on SQLite, a
+  tsvector column with a GIN index on PostgreSQL. The crawler keeps it in
+  sync through NewsSearchRepository.
+  """
+  if engine.dialect.name == "postgresql":
+    with engine.begin() as conn:
+      conn.execute(text("ALTER TABLE news ADD COLUMN IF NOT EXISTS search_vector tsvector"))
+      conn.execute(text("CREATE INDEX IF NOT EXISTS ix_news_search_vector ON news USING GIN (search_vector)"))
+      filled = conn.execute(text(f"UPDATE news SET search_vector = {POSTGRES_VECTOR} WHERE search_vector IS NULL")).rowcount
+  else:
+    created = not inspect(engine).has_table("news_fts")
+    with engine.begin() as conn:
+      conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts "
+        "USING fts5(title, description, content, content='news', content_rowid='id')"
+      ))
+      filled = 0
+      if created:
+        conn.execute(text("INSERT INTO news_fts(news_fts) VALUES ('rebuild')"))
+        filled = conn.execute(text("SELECT COUNT(*) FROM news")).scalar()
+  if filled:
+    print(f"Indexed {filled} news for search")
+
+def has_news_search(conn: Connection) -> bool:
+  """Whether `ensure_news_search` has run on this database."""
+  inspector = inspect(conn)
+  if conn.dialect.name == "postgresql":
+    return inspector.has_table("news") and any(column["name"] == "search_vector" for column in inspector.get_columns("news"))
+  return inspector.has_table("news_fts")
+
+def fts5_query(q: str) -> str:
+  """Every word of `q` as a quoted FTS5 term, so user input never reaches the query syntax."""
+  return " ".join(f'"{term}"' for term in re.findall(r"\w+", q))
+
+class NewsSearchRepository:
+  def __init__(self, db: Session):
+    self.db = db
+
+  @property
+  def is_postgres(self) -> bool:
+    return self.db.get_bind().dialect.name == "postgresql"
+
+  def remove(self, ids: Iterable[int]) -> None:
+    """
+    Drop rows from the SQLite index. Call before the rows change, since the
+    external-content table reads the indexed values back from `news`.
+    On PostgreSQL the vector lives on the row, so there is nothing to do.
+    """
+    ids = list(ids)
+    if ids and not self.is_postgres:
+      statement = text("DELETE FROM news_fts WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True))
+      self.db.execute(statement, {"ids": ids})
+
+  def add(self, ids: Iterable[int]) -> None:
+    """Index rows after they are written, in the caller's transaction."""
+    ids = list(ids)
+    if not ids:
+      return
+    if self.is_postgres:
+      statement = text(f"UPDATE news SET search_vector = {POSTGRES_VECTOR} WHERE id IN :ids")
+    else:
+      statement = text(
+        "INSERT INTO news_fts(rowid, title, description, content) "
+        "SELECT id, title, description, content FROM news WHERE id IN :ids"
+      )
+    self.db.execute(statement.bindparams(bindparam("ids", expanding=True)), {"ids": ids})
+
+  def is_ready(self) -> bool:
+    return has_news_search(self.db.connection())
+
+  def search(self, q: str, limit: int = 10, after: Optional[Tuple[float, int]] = None) -> Page[NewsSummaryDto]:
+    """
+    Best match first, continuing after the `(score, id)` key of the previous
+    page. Only the summary columns of the matches are read.
+    """
+    if self.is_postgres:
+      params = {"q": q}
+      ranked = (
+        "SELECT id, ts_rank_cd(search_vector, query) AS score "
+        "FROM news, websearch_to_tsquery('english', :q) AS query WHERE search_vector @@ query"
+      )
+    else:
+      params = {"q": fts5_query(q)}
+      if not params["q"]:
+        return Page([])
+      # bm25 is lower for better matches; negate it so both dialects sort by score descending
+      ranked = f"SELECT rowid AS id, -bm25(news_fts, {FTS5_WEIGHTS}) AS score FROM news_fts WHERE news_fts MATCH :q"
+
+    sql = f"SELECT id, score FROM ({ranked}) AS ranked"
+    if after:
+      sql += " WHERE score < :score OR (score = :score AND id < :id)"
+      params["score"], params["id"] = after
+    sql += " ORDER BY score DESC, id DESC LIMIT :limit"
+    params["limit"] = limit + 1
+
+    matches, next_key = paginate(self.db.execute(text(sql), params).all(), limit, lambda match: (match.score, match.id))
+    ids = [match.id for match in matches]
+    rows = {row.id: row for row in self.db.query(*NEWS_SUMMARY_COLUMNS).filter(NewsModel.id.in_(ids)).all()}
+    return Page(NewsSummaryDto.from_rows(rows[id] for id in ids if id in rows), next_key)
+
+class AsyncNewsSearchRepository:
+  """NewsSearchRepository on an AsyncSession; queries run through the async driver."""
+  def __init__(self, db: AsyncSession):
+    self.db = db
+
+  async def is_ready(self) -> bool:
+    return await self.db.run_sync(lambda db: NewsSearchRepository(db).is_ready())
+
+  async def search(self, q: str, limit: int = 10, after: Optional[Tuple[float, int]] = None) -> Page[NewsSummaryDto]:
+    return await self.db.run_sync(lambda db: NewsSearchRepository(db).search(q, limit, after))
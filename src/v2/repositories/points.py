@@ -2,8 +2,7 @@ from sqlalchemy.orm import Session, joinedload
 from src.v2.models.result import Result as ResultModel
 from src.v2.models.session import Session as SessionModel
 from src.v2.models.driver import Driver as DriverModel
-from sqlalchemy import func
-from src.core.database import SessionLocal
+from sqlalchemy import func, case
 
 class PointRepository:
     def __init__(self, db: Session):
@@ -31,6 +30,41 @@ class PointRepository:
             for row in results
         ]
 
+    def get_driver_stats_subquery(self):
+        """
+        Points, podiums and wins per driver in a single grouped query.
+        Only race sessions count, podiums and wins are conditional aggregates.
+        """
+        return (self.db.query(
+                    ResultModel.driver_number.label('driver_number'),
+                    func.sum(ResultModel.points).label('total_points'),
+                    func.sum(case((ResultModel.position.in_([1, 2, 3]), 1), else_=0)).label('podiums'),
+                    func.sum(case((ResultModel.position == 1, 1), else_=0)).label('wins')
+                )
+                .join(SessionModel, ResultModel.session_id == SessionModel.id)
+                .filter(SessionModel.session_type == "Race")
+                .group_by(ResultModel.driver_number)
+                .subquery())
+
+    def get_team_stats_subquery(self):
+        """
+        Points, podiums and wins per constructor, attributed through the team
+        stored on each result. Results ingested before teams were recorded
+        fall back to the driver's current team.
+        """
+        constructor_id = func.coalesce(ResultModel.constructor_id, DriverModel.currentTeam)
+        return (self.db.query(
+                    constructor_id.label('constructor_id'),
+                    func.sum(ResultModel.points).label('total_points'),
+                    func.sum(case((ResultModel.position.in_([1, 2, 3]), 1), else_=0)).label('podiums'),
+                    func.sum(case((ResultModel.position == 1, 1), else_=0)).label('wins')
+                )
+                .join(SessionModel, ResultModel.session_id == SessionModel.id)
+                .outerjoin(DriverModel, ResultModel.driver_number == DriverModel.permanentNumber)
+                .filter(SessionModel.session_type == "Race")
+                .group_by(constructor_id)
+                .subquery())
+
     def get_point_by_driver_number(self, driver_number: int):
         result = (self.db.query(
                     ResultModel.driver_number,
@@ -58,6 +92,8 @@ class PointRepository:
         }
 
 if __name__ == "__main__":
+    from src.core.database import SessionLocal
+    
     db = SessionLocal()
     point_repository = PointRepository(db)
     points = point_repository.get_points()
@@ -1,35 +1,72 @@
+from typing import Optional, Tuple
 from src.v2.models.result import Result as ResultModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.v2.dto.results import ResultDto
+from src.v2.dto.results import ResultDto, RESULT_COLUMNS
+from src.v2.utils.pagination import Page, paginate
 
 class ResultRepository:
   def __init__(self, db: Session):
     self.db = db
     
   def get_results(self):
-    results = self.db.query(ResultModel).all()
-    return [ResultDto.from_model(result) for result in results]
+    results = self.db.query(*RESULT_COLUMNS).all()
+    return ResultDto.from_rows(results)
+      
+  def get_results_page(self, limit: int, after: Optional[Tuple[int]] = None, driver_number: Optional[int] = None) -> Page[ResultDto]:
+    """Keyset page ordered by id, continuing after the `(id,)` key of the previous page."""
+    query = self.db.query(*RESULT_COLUMNS)
+    if driver_number:
+      query = query.filter(ResultModel.driver_number == driver_number)
+    if after:
+      query = query.filter(ResultModel.id > after[0])
+    rows = query.order_by(ResultModel.id).limit(limit + 1).all()
+    results, next_key = paginate(rows, limit, lambda result: (result.id,))
+    return Page(ResultDto.from_rows(results), next_key)
       
   def get_results_by_driver_number(self, driver_number):
-    results = self.db.query(ResultModel).filter(ResultModel.driver_number == driver_number).all()
-    return [ResultDto.from_model(result) for result in results]
+    results = self.db.query(*RESULT_COLUMNS).filter(ResultModel.driver_number == driver_number).all()
+    return ResultDto.from_rows(results)
   
   def get_results_by_session_key(self, session_key):
-    results = self.db.query(ResultModel).filter(ResultModel.session_id == session_key).all()
-    return [ResultDto.from_model(result) for result in results]
+    results = self.db.query(*RESULT_COLUMNS).filter(ResultModel.session_id == session_key).all()
+    return ResultDto.from_rows(results)
   
   def get_podiums(self, driver_number):
-    results = (self.db.query(ResultModel)
+    results = (self.db.query(*RESULT_COLUMNS)
                .filter(ResultModel.driver_number == driver_number)
                .filter(ResultModel.session.has(session_type="Race"))
                .filter(ResultModel.position.in_([1, 2, 3]))
                .all())
-    return [ResultDto.from_model(result) for result in results]
+    return ResultDto.from_rows(results)
     
   def get_wins(self, driver_number):
-    results = (self.db.query(ResultModel)
+    results = (self.db.query(*RESULT_COLUMNS)
                .filter(ResultModel.driver_number == driver_number)
                .filter(ResultModel.session.has(session_type="Race"))
                .filter(ResultModel.position == 1)
                .all())
-    return [ResultDto.from_model(result) for result in results]
+    return ResultDto.from_rows(results)
+
+class AsyncResultRepository:
+  """ResultRepository on an AsyncSession; queries run through the async driver."""
+  def __init__(self, db: AsyncSession):
+    self.db = db
+  
+  async def get_results(self):
+    return await self.db.run_sync(lambda db: ResultRepository(db).get_results())
+  
+  async def get_results_page(self, limit: int, after: Optional[Tuple[int]] = None, driver_number: Optional[int] = None) -> Page[ResultDto]:
+    return await self.db.run_sync(lambda db: ResultRepository(db).get_results_page(limit, after, driver_number))
+  
+  async def get_results_by_driver_number(self, driver_number):
+    return await self.db.run_sync(lambda db: ResultRepository(db).get_results_by_driver_number(driver_number))
+  
+  async def get_results_by_session_key(self, session_key):
+    return await self.db.run_sync(lambda db: ResultRepository(db).get_results_by_session_key(session_key))
+  
+  async def get_podiums(self, driver_number):
+    return await self.db.run_sync(lambda db: ResultRepository(db).get_podiums(driver_number))
+  
+  async def get_wins(self, driver_number):
+    return await self.db.run_sync(lambda db: ResultRepository(db).get_wins(driver_number))
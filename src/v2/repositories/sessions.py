@@ -1,16 +1,146 @@
-from sqlalchemy.orm import Session
+from collections import defaultdict
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
 from src.v2.models.session import Session as SessionModel
-from src.v2.dto.sessions import SessionDto
-from typing import List
+from src.v2.models.result import Result as ResultModel
+from src.v2.dto.results import ResultDto, RESULT_COLUMNS
+from src.v2.dto.sessions import SessionDto, SESSION_FIELDS, SESSION_INCLUDES
+from src.v2.utils.pagination import Page, paginate
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple, Union
+
+class ResultLoading(str, Enum):
+    """How session results are loaded when building SessionDto objects."""
+    DYNAMIC = "dynamic"  # one query per session through Session.results
+    BATCHED = "batched"  # one IN (...) query for all requested sessions
 
 class SessionRepository:
-    def __init__(self, db: Session):
+    """
+    Session listings. `fields` selects the columns to return and `include` the
+    embeds ('results', 'weather'); leaving both at their defaults returns full
+    SessionDto objects, anything else returns plain dicts.
+    """
+    def __init__(self, db: Session, result_loading: ResultLoading = ResultLoading.BATCHED):
+      self.db = db
+      self.result_loading = result_loading
+    
+    def _load_results(self, session_ids: List[int]) -> Dict[int, List[ResultDto]]:
+      results_by_session = defaultdict(list)
+      if not session_ids:
+        return results_by_session
+      rows = self.db.query(*RESULT_COLUMNS)\
+                    .filter(ResultModel.session_id.in_(session_ids))\
+                    .order_by(ResultModel.session_id, ResultModel.id)\
+                    .all()
+      for result in ResultDto.from_rows(rows):
+        results_by_session[result.session_id].append(result)
+      return results_by_session
+    
+    @staticmethod
+    def _is_sparse(fields: Optional[Sequence[str]], include: Collection[str]) -> bool:
+      return fields is not None or set(include) != set(SESSION_INCLUDES)
+    
+    def _query(self, fields: Optional[Sequence[str]], include: Collection[str]):
+      query = self.db.query(SessionModel)
+      if self._is_sparse(fields, include):
+        # id and session_date are always needed for keyset pagination
+        columns = {'id', 'session_date', *(fields or SESSION_FIELDS)}
+        if 'weather' in include:
+          columns.add('weather_summary')
+        query = query.options(load_only(*(getattr(SessionModel, column) for column in sorted(columns))))
+      return query
+    
+    def _to_dtos(
+      self,
+      sessions: List[SessionModel],
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> List[Union[SessionDto, Dict[str, Any]]]:
+      if self._is_sparse(fields, include):
+        results_by_session = None
+        if 'results' in include and self.result_loading == ResultLoading.BATCHED:
+          results_by_session = self._load_results([session.id for session in sessions])
+        return SessionDto.sparse_from_models(sessions, fields or SESSION_FIELDS, include, results_by_session)
+      if self.result_loading == ResultLoading.DYNAMIC:
+        return [SessionDto.from_model(session) for session in sessions]
+      results_by_session = self._load_results([session.id for session in sessions])
+      return SessionDto.from_models(sessions, results_by_session)
+    
+    def get_sessions(
+      self,
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> List[Union[SessionDto, Dict[str, Any]]]:
+      sessions = self._query(fields, include)\
+                     .order_by(SessionModel.session_date, SessionModel.id)\
+                     .all()
+      return self._to_dtos(sessions, fields, include)
+    
+    def get_sessions_page(
+      self,
+      limit: int,
+      after: Optional[Tuple[datetime, int]] = None,
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> Page:
+      """Calendar order, continuing after the `(session_date, id)` key of the previous page."""
+      query = self._query(fields, include)
+      if after:
+        session_date, session_id = after
+        query = query.filter(or_(
+          SessionModel.session_date > session_date,
+          and_(SessionModel.session_date == session_date, SessionModel.id > session_id)
+        ))
+      rows = query.order_by(SessionModel.session_date, SessionModel.id)\
+                  .limit(limit + 1)\
+                  .all()
+      sessions, next_key = paginate(rows, limit, lambda session: (session.session_date, session.id))
+      return Page(self._to_dtos(sessions, fields, include), next_key)
+    
+    def get_session_by_session_id(
+      self,
+      session_id: int,
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> Union[SessionDto, Dict[str, Any]]:
+      session = self._query(fields, include).filter(SessionModel.id == session_id).first()
+      return self._to_dtos([session], fields, include)[0]
+
+class AsyncSessionRepository:
+    """
+    SessionRepository on an AsyncSession. The sync code runs through
+    `run_sync`, so lazy loads (dynamic results, the deferred weather fallback)
+    still go through the async driver instead of failing.
+    """
+    def __init__(self, db: AsyncSession, result_loading: ResultLoading = ResultLoading.BATCHED):
       self.db = db
+      self.result_loading = result_loading
+    
+    def _repository(self, db: Session) -> SessionRepository:
+      return SessionRepository(db, result_loading=self.result_loading)
+    
+    async def get_sessions(
+      self,
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> List[Union[SessionDto, Dict[str, Any]]]:
+      return await self.db.run_sync(lambda db: self._repository(db).get_sessions(fields, include))
     
-    def get_sessions(self) -> List[SessionDto]:
-      sessions = self.db.query(SessionModel).all()
-      return [SessionDto.from_model(session) for session in sessions]
+    async def get_sessions_page(
+      self,
+      limit: int,
+      after: Optional[Tuple[datetime, int]] = None,
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> Page:
+      return await self.db.run_sync(lambda db: self._repository(db).get_sessions_page(limit, after, fields, include))
     
-    def get_session_by_session_id(self, session_id: int) -> SessionDto:
-      session = self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
-      return SessionDto.from_model(session)
\ No newline at end of file
+    async def get_session_by_session_id(
+      self,
+      session_id: int,
+      fields: Optional[Sequence[str]] = None,
+      include: Collection[str] = SESSION_INCLUDES
+    ) -> Union[SessionDto, Dict[str, Any]]:
+      return await self.db.run_sync(lambda db: self._repository(db).get_session_by_session_id(session_id, fields, include))
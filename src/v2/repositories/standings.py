@@ -0,0 +1,107 @@
+from typing import List
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.v2.models.driver import Driver as DriverModel
+from src.v2.models.team import Team as TeamModel
+from src.v2.models.standing import DriverStanding as DriverStandingModel, TeamStanding as TeamStandingModel
+from src.v2.repositories.points import PointRepository
+from src.v2.dto.standings import DriverStandingDto, TeamStandingDto
+
+def _rank(standings: List[dict], key: str) -> List[dict]:
+    # Points first, then wins and podiums as tie-breakers
+    standings.sort(key=lambda s: (-s["points"], -s["wins"], -s["podiums"], s[key]))
+    for position, standing in enumerate(standings, 1):
+        standing["position"] = position
+    return standings
+
+class StandingRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.point_repository = PointRepository(db)
+    
+    def refresh(self) -> None:
+        """
+        Recompute driver and constructor standings from the results table.
+        Constructor totals follow the team stored on each result, so points
+        stay with the team they were scored for when a driver changes teams.
+        """
+        stats = self.point_repository.get_driver_stats_subquery()
+        rows = (self.db.query(
+                    DriverModel.permanentNumber,
+                    stats.c.total_points,
+                    stats.c.podiums,
+                    stats.c.wins
+                )
+                .outerjoin(stats, stats.c.driver_number == DriverModel.permanentNumber)
+                .all())
+        team_stats = self.point_repository.get_team_stats_subquery()
+        team_rows = (self.db.query(
+                        TeamModel.constructorId,
+                        team_stats.c.total_points,
+                        team_stats.c.podiums,
+                        team_stats.c.wins
+                    )
+                    .outerjoin(team_stats, team_stats.c.constructor_id == TeamModel.constructorId)
+                    .all())
+        
+        now = datetime.now(timezone.utc)
+        drivers = [
+            {
+                "driver_number": driver_number,
+                "points": float(total_points) if total_points is not None else 0.0,
+                "wins": wins or 0,
+                "podiums": podiums or 0,
+                "updated_at": now
+            }
+            for driver_number, total_points, podiums, wins in rows
+        ]
+        teams = [
+            {
+                "constructor_id": constructor_id,
+                "points": float(total_points) if total_points is not None else 0.0,
+                "wins": wins or 0,
+                "podiums": podiums or 0,
+                "updated_at": now
+            }
+            for constructor_id, total_points, podiums, wins in team_rows
+        ]
+        
+        try:
+            self.db.query(DriverStandingModel).delete(synchronize_session=False)
+            self.db.query(TeamStandingModel).delete(synchronize_session=False)
+            self.db.bulk_insert_mappings(DriverStandingModel, _rank(drivers, "driver_number"))
+            self.db.bulk_insert_mappings(TeamStandingModel, _rank(teams, "constructor_id"))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def get_driver_standings(self) -> List[DriverStandingDto]:
+        standings = self.db.query(DriverStandingModel).order_by(DriverStandingModel.position).all()
+        return [DriverStandingDto.from_model(standing) for standing in standings]
+    
+    def get_team_standings(self) -> List[TeamStandingDto]:
+        standings = self.db.query(TeamStandingModel).order_by(TeamStandingModel.position).all()
+        return [TeamStandingDto.from_model(standing) for standing in standings]
+
+class AsyncStandingRepository:
+    """Read side of StandingRepository on an AsyncSession; refreshes stay with the crawlers."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_driver_standings(self) -> List[DriverStandingDto]:
+        return await self.db.run_sync(lambda db: StandingRepository(db).get_driver_standings())
+    
+    async def get_team_standings(self) -> List[TeamStandingDto]:
+        return await self.db.run_sync(lambda db: StandingRepository(db).get_team_standings())
+
+if __name__ == "__main__":
+    from src.core.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        StandingRepository(db).refresh()
+        print("Standings refreshed")
+    finally:
+        db.close()
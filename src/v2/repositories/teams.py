@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.v2.models.team import Team as TeamModel
 from src.v2.dto.teams import TeamDto
@@ -16,3 +17,14 @@ class TeamRepository:
         if not team:
             return None
         return TeamDto.from_model(team)
+
+class AsyncTeamRepository:
+    """TeamRepository on an AsyncSession; queries run through the async driver."""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def get_teams(self) -> List[TeamDto]:
+        return await self.db.run_sync(lambda db: TeamRepository(db).get_teams())
+    
+    async def get_team_by_name(self, name: str) -> Optional[TeamDto]:
+        return await self.db.run_sync(lambda db: TeamRepository(db).get_team_by_name(name))
@@ -4,6 +4,7 @@ from .circuits import router as circuits_router
 from .sessions import router as sessions_router
 from .results import router as results_router
 from .news import router as news_router
+from .standings import router as standings_router
 
 routers = [
   teams_router,
@@ -12,4 +13,5 @@ routers = [
   sessions_router,
   results_router,
   news_router,
+  standings_router,
 ]
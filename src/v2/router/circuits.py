@@ -1,14 +1,20 @@
-from fastapi import APIRouter, Depends
-from src.v2.repositories.circuits import CircuitRepository
-from sqlalchemy.orm import Session
-from src.core.database.database import get_db
-from typing import Optional
+from fastapi import APIRouter, Depends, Request
+from src.v2.repositories.circuits import AsyncCircuitRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_async_db
+from src.v2.utils.response_cache import cached_response
+from typing import List, Optional, Union
+from src.v2.dto.circuits import CircuitDto
 
 router = APIRouter(prefix="/v2/circuits", tags=["circuits"])
 
-@router.get("")
-def get_circuits(circuit_id: Optional[int] = None, db: Session = Depends(get_db)):
-  circuit_repository = CircuitRepository(db)
+CACHE_TTL = 3600
+CACHE_TABLES = ("circuits",)
+
+@router.get("", response_model=Union[List[CircuitDto], CircuitDto])
+async def get_circuits(request: Request, circuit_id: Optional[int] = None, db: AsyncSession = Depends(get_async_db)):
+  circuit_repository = AsyncCircuitRepository(db)
   if circuit_id:
-    return circuit_repository.get_circuit_by_circuit_id(circuit_id)
-  return circuit_repository.get_circuits()
+    return await cached_response(request, db, ("circuits", circuit_id), CACHE_TABLES, CACHE_TTL,
+                                 lambda: circuit_repository.get_circuit_by_circuit_id(circuit_id))
+  return await cached_response(request, db, ("circuits",), CACHE_TABLES, CACHE_TTL, circuit_repository.get_circuits)
@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends
-from src.v2.repositories.drivers import DriverRepository
-from sqlalchemy.orm import Session
-from src.core.database.database import get_db
+from fastapi import APIRouter, Depends, Request
+from src.v2.repositories.drivers import AsyncDriverRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_async_db
+from src.v2.utils.response_cache import cached_response
+from src.v2.dto.drivers import DriverDto
+from typing import List
 
 router = APIRouter(prefix="/v2/drivers", tags=["drivers"])
 
-@router.get("")
-def get_drivers(db: Session = Depends(get_db)):
-  driver_repository = DriverRepository(db)
-  return driver_repository.get_drivers()
+CACHE_TTL = 300
+CACHE_TABLES = ("drivers", "standings")
+
+@router.get("", response_model=List[DriverDto])
+async def get_drivers(request: Request, db: AsyncSession = Depends(get_async_db)):
+  driver_repository = AsyncDriverRepository(db)
+  return await cached_response(request, db, ("drivers",), CACHE_TABLES, CACHE_TTL, driver_repository.get_drivers)
@@ -1,16 +1,58 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from src.core.database.database import get_db
-from src.v2.repositories.news import NewsRepository
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_async_db
+from src.v2.repositories.news import AsyncNewsRepository
+from src.v2.repositories.news_search import AsyncNewsSearchRepository
+from src.v2.utils.response_cache import cached_response
+from src.v2.utils.pagination import MAX_PAGE_SIZE, parse_cursor
+from typing import List, Optional
+from src.v2.dto.news import NewsDto, NewsSummaryDto
 
 router = APIRouter(prefix="/v2/news", tags=["news"])
 
-@router.get("")
-def get_news(
-  limit: int = 10,
-  db: Session = Depends(get_db)
+CACHE_TTL = 120
+CACHE_TABLES = ("news",)
+
+@router.get("", response_model=List[NewsSummaryDto])
+async def get_news(
+  request: Request,
+  limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+  cursor: Optional[str] = None,
+  db: AsyncSession = Depends(get_async_db)
+):
+  news_repository = AsyncNewsRepository(db)
+  after = parse_cursor(cursor, (datetime, int))
+  return await cached_response(request, db, ("news", limit, cursor), CACHE_TABLES, CACHE_TTL,
+                               lambda: news_repository.get_news_page(limit, after))
+
+@router.get("/search", response_model=List[NewsSummaryDto])
+async def search_news(
+  request: Request,
+  q: str = Query(..., min_length=1, max_length=200),
+  limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+  cursor: Optional[str] = None,
+  db: AsyncSession = Depends(get_async_db)
 ):
-  news_repository = NewsRepository(db)
-  return news_repository.get_latest_news(limit)
+  search_repository = AsyncNewsSearchRepository(db)
+  after = parse_cursor(cursor, (float, int))
+  
+  async def load():
+    # The index is built by the news crawler; until it has run there is nothing to search
+    if not await search_repository.is_ready():
+      raise HTTPException(status_code=503, detail="News search index is not built yet")
+    return await search_repository.search(q, limit, after)
+  
+  return await cached_response(request, db, ("news_search", q, limit, cursor), CACHE_TABLES, CACHE_TTL, load)
 
+@router.get("/{news_id}", response_model=NewsDto)
+async def get_news_by_id(request: Request, news_id: int, db: AsyncSession = Depends(get_async_db)):
+  news_repository = AsyncNewsRepository(db)
+  
+  async def load():
+    news = await news_repository.get_news_by_id(news_id)
+    if news is None:
+      raise HTTPException(status_code=404, detail="News not found")
+    return news
   
+  return await cached_response(request, db, ("news_detail", news_id), CACHE_TABLES, CACHE_TTL, load)
@@ -1,26 +1,36 @@
-from fastapi import APIRouter, Depends
-from src.v2.repositories.results import ResultRepository
-from src.core.database.database import get_db
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from src.v2.repositories.results import AsyncResultRepository
+from src.core.database.database import get_async_db
+from src.v2.utils.response_cache import cached_response
+from src.v2.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_cursor
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from src.v2.dto.results import ResultDto
 
 router = APIRouter(prefix="/v2/results", tags=["results"])
 
-@router.get("")
-def get_results(
+CACHE_TTL = 60
+CACHE_TABLES = ("results", "sessions")
+
+@router.get("", response_model=List[ResultDto])
+async def get_results(
+  request: Request,
   driver_number: Optional[int] = None, 
-  db: Session = Depends(get_db)
+  limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+  cursor: Optional[str] = None,
+  db: AsyncSession = Depends(get_async_db)
 ):
-  result_repository = ResultRepository(db)
-  if driver_number:
-    return result_repository.get_results_by_driver_number(driver_number)
-  return result_repository.get_results()
+  result_repository = AsyncResultRepository(db)
+  after = parse_cursor(cursor, (int,))
+  return await cached_response(request, db, ("results", driver_number, limit, cursor), CACHE_TABLES, CACHE_TTL,
+                               lambda: result_repository.get_results_page(limit, after, driver_number))
 
-@router.get("/podiums")
-def get_podiums(
+@router.get("/podiums", response_model=List[ResultDto])
+async def get_podiums(
+  request: Request,
   driver_number: int, 
-  db: Session = Depends(get_db)
+  db: AsyncSession = Depends(get_async_db)
 ):
-  result_repository = ResultRepository(db)
-  return result_repository.get_podiums(driver_number)
-
+  result_repository = AsyncResultRepository(db)
+  return await cached_response(request, db, ("podiums", driver_number), CACHE_TABLES, CACHE_TTL,
+                               lambda: result_repository.get_podiums(driver_number))
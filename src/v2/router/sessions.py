@@ -1,14 +1,47 @@
-from fastapi import APIRouter, Depends
-from src.v2.repositories.sessions import SessionRepository
-from sqlalchemy.orm import Session
-from src.core.database.database import get_db
-from typing import Optional
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from src.v2.repositories.sessions import AsyncSessionRepository, ResultLoading
+from src.v2.dto.sessions import SessionDto, SESSION_FIELDS, SESSION_INCLUDES
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_async_db
+from src.v2.utils.response_cache import cached_response
+from src.v2.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_cursor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 router = APIRouter(prefix="/v2/sessions", tags=["sessions"])
 
-@router.get("")
-def get_sessions(session_id: Optional[int] = None, db: Session = Depends(get_db)):
-  session_repository = SessionRepository(db)
+CACHE_TTL = 60
+CACHE_TABLES = ("sessions", "results")
+
+def _parse_list(value: str, allowed: Sequence[str], name: str) -> Tuple[str, ...]:
+  items = tuple(dict.fromkeys(item.strip() for item in value.split(",") if item.strip()))
+  unknown = [item for item in items if item not in allowed]
+  if unknown:
+    raise HTTPException(status_code=400, detail=f"Unknown {name}: {', '.join(unknown)}. Allowed: {', '.join(allowed)}")
+  return items
+
+# Sparse requests (`fields` / `include`) return only the selected keys of SessionDto
+@router.get("", response_model=Union[List[SessionDto], SessionDto, List[Dict[str, Any]], Dict[str, Any]])
+async def get_sessions(
+  request: Request,
+  session_id: Optional[int] = None,
+  limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+  cursor: Optional[str] = None,
+  fields: Optional[str] = Query(None, description=f"Comma separated columns: {', '.join(SESSION_FIELDS)}"),
+  include: Optional[str] = Query(None, description="Comma separated embeds: results, weather. Defaults to both unless fields is given"),
+  db: AsyncSession = Depends(get_async_db)
+):
+  selected_fields = _parse_list(fields, SESSION_FIELDS, "fields") if fields is not None else None
+  if include is not None:
+    includes = _parse_list(include, SESSION_INCLUDES, "include")
+  else:
+    # Sparse requests embed nothing unless asked to
+    includes = () if selected_fields is not None else SESSION_INCLUDES
+  
+  session_repository = AsyncSessionRepository(db, result_loading=ResultLoading.BATCHED)
   if session_id:
-    return session_repository.get_session_by_session_id(session_id)
-  return session_repository.get_sessions()
+    return await cached_response(request, db, ("sessions", session_id, selected_fields, includes), CACHE_TABLES, CACHE_TTL,
+                                 lambda: session_repository.get_session_by_session_id(session_id, selected_fields, includes))
+  after = parse_cursor(cursor, (datetime, int))
+  return await cached_response(request, db, ("sessions", limit, cursor, selected_fields, includes), CACHE_TABLES, CACHE_TTL,
+                               lambda: session_repository.get_sessions_page(limit, after, selected_fields, includes))
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Request
+from src.v2.repositories.standings import AsyncStandingRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_async_db
+from src.v2.utils.response_cache import cached_response
+from src.v2.dto.standings import DriverStandingDto, TeamStandingDto
+from typing import List
+
+router = APIRouter(prefix="/v2/standings", tags=["standings"])
+
+CACHE_TTL = 300
+CACHE_TABLES = ("standings",)
+
+@router.get("/drivers", response_model=List[DriverStandingDto])
+async def get_driver_standings(request: Request, db: AsyncSession = Depends(get_async_db)):
+  standing_repository = AsyncStandingRepository(db)
+  return await cached_response(request, db, ("standings", "drivers"), CACHE_TABLES, CACHE_TTL, standing_repository.get_driver_standings)
+
+@router.get("/teams", response_model=List[TeamStandingDto])
+async def get_team_standings(request: Request, db: AsyncSession = Depends(get_async_db)):
+  standing_repository = AsyncStandingRepository(db)
+  return await cached_response(request, db, ("standings", "teams"), CACHE_TABLES, CACHE_TTL, standing_repository.get_team_standings)
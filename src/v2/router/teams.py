@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends
-from src.v2.repositories.teams import TeamRepository
-from typing import Optional
-from sqlalchemy.orm import Session
-from src.core.database.database import get_db
+from fastapi import APIRouter, Depends, Request
+from src.v2.repositories.teams import AsyncTeamRepository
+from typing import List, Optional, Union
+from src.v2.dto.teams import TeamDto
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.database.database import get_async_db
+from src.v2.utils.response_cache import cached_response
 
 router = APIRouter(prefix="/v2/teams", tags=["teams"])
 
-@router.get("")
-def get_teams(
+CACHE_TTL = 3600
+CACHE_TABLES = ("teams",)
+
+@router.get("", response_model=Union[List[TeamDto], Optional[TeamDto]])
+async def get_teams(
+  request: Request,
   name: Optional[str] = None,
-  db: Session = Depends(get_db)
+  db: AsyncSession = Depends(get_async_db)
 ):
-  team_repository = TeamRepository(db)
+  team_repository = AsyncTeamRepository(db)
   if name:
-    return team_repository.get_team_by_name(name)
-  return team_repository.get_teams()
+    return await cached_response(request, db, ("teams", name), CACHE_TABLES, CACHE_TTL,
+                                 lambda: team_repository.get_team_by_name(name))
+  return await cached_response(request, db, ("teams",), CACHE_TABLES, CACHE_TTL, team_repository.get_teams)
@@ -1,9 +1,12 @@
-import pandas as pd
-import numpy as np
 import json
-from typing import Dict, Any, List, Optional, Union
+import math
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
 
+if TYPE_CHECKING:
+    # pandas is imported on first use so the API process does not load it at startup
+    import pandas as pd
+
 class WeatherCondition(str, Enum):
     DRY = "dry"
     DRIZZLE = "drizzle"
@@ -13,7 +16,13 @@ class WeatherCondition(str, Enum):
     HUMID = "humid"
     UNKNOWN = "unknown"
 
-def analyze_weather_conditions(weather_data: Union[Dict, List[Dict], pd.DataFrame]) -> Dict[str, Any]:
+# Above this many samples the vectorized pandas path is faster than the pure Python one
+FAST_PATH_MAX_SAMPLES = 20_000
+
+_RAINFALL_FLAGS = {'true': 1, 'false': 0, '1': 1, '0': 0}
+_SUMMARY_COLUMNS = ('Rainfall', 'AirTemp', 'Humidity', 'WindSpeed')
+
+def analyze_weather_conditions(weather_data: Union[Dict, List[Dict], 'pd.DataFrame']) -> Dict[str, Any]:
     """
     Analyze weather data and determine detailed weather conditions.
     
@@ -29,13 +38,29 @@ def analyze_weather_conditions(weather_data: Union[Dict, List[Dict], pd.DataFram
             - average_humidity (float): Average humidity in percentage
             - wind_speed (float): Average wind speed in km/h
     """
+    if isinstance(weather_data, str):
+        try:
+            weather_data = json.loads(weather_data)
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON string provided")
+    
+    # Plain records from the database skip DataFrame construction entirely;
+    # frames and very large payloads keep the vectorized pandas path.
+    if isinstance(weather_data, (list, dict)):
+        columns = _to_columns(weather_data)
+        if columns is not None and columns[1] <= FAST_PATH_MAX_SAMPLES:
+            result = _analyze_columns(*columns)
+            if result is not None:
+                return result
+    
+    return _analyze_with_pandas(weather_data)
+
+def _analyze_with_pandas(weather_data: Union[Dict, List[Dict], 'pd.DataFrame']) -> Dict[str, Any]:
+    """DataFrame implementation, used for frames, large payloads and unusual value types."""
+    import pandas as pd
+    
     # Convert input to DataFrame if it's not already
     if not isinstance(weather_data, pd.DataFrame):
-        if isinstance(weather_data, str):
-            try:
-                weather_data = json.loads(weather_data)
-            except json.JSONDecodeError:
-                raise ValueError("Invalid JSON string provided")
         df = pd.DataFrame(weather_data)
     else:
         df = weather_data.copy()
@@ -91,19 +116,188 @@ def analyze_weather_conditions(weather_data: Union[Dict, List[Dict], pd.DataFram
         condition_ratio=condition_ratio,
         avg_humidity=avg_humidity,
         avg_wind_speed=avg_wind_speed,
-        weather_data=df
+        is_rain_clearing=lambda: _is_rain_clearing_pandas(df)
     )
     
+    return _format_summary(weather_condition, round(condition_ratio, 2), avg_temp, avg_humidity, avg_wind_speed)
+
+def _format_summary(weather_condition: WeatherCondition, condition_ratio: float, avg_temp: float,
+                    avg_humidity: float, avg_wind_speed: float) -> Dict[str, Any]:
     return {
         'weather_condition': weather_condition.value,
-        'condition_ratio': f"{round(condition_ratio, 2) * 100}%",
+        'condition_ratio': f"{condition_ratio * 100}%",
         'average_temperature': f"{round(float(avg_temp), 1)}°C",
         'average_humidity': f"{round(float(avg_humidity), 1)}%",
         'wind_speed': f"{round(float(avg_wind_speed), 1)}km/h"
     }
 
+def _to_columns(weather_data: Union[Dict, List[Dict]]) -> Optional[Tuple[Dict[str, list], int]]:
+    """
+    Turn records (or a dict of equal-length lists) into columns, mirroring how
+    `pd.DataFrame` aligns them. Returns None for shapes the fast path does not handle.
+    """
+    if isinstance(weather_data, dict):
+        if not all(isinstance(values, list) for values in weather_data.values()):
+            return None
+        lengths = {len(values) for values in weather_data.values()}
+        if len(lengths) > 1:
+            return None
+        return dict(weather_data), lengths.pop() if lengths else 0
+    
+    if not all(isinstance(record, dict) for record in weather_data):
+        return None
+    keys = set().union(*weather_data)
+    # Only the columns the summary reads are materialized
+    columns = {key: [record.get(key) for record in weather_data] for key in _SUMMARY_COLUMNS if key in keys}
+    return columns, len(weather_data)
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _pairwise_sum(values: List[float], start: int, count: int) -> float:
+    """Pairwise summation in the same order as numpy, so means match pandas bit for bit."""
+    if count < 8:
+        total = 0.0
+        for i in range(start, start + count):
+            total += values[i]
+        return total
+    if count <= 128:
+        r = values[start:start + 8]
+        unrolled = count - count % 8
+        for i in range(start + 8, start + unrolled, 8):
+            r[0] += values[i]
+            r[1] += values[i + 1]
+            r[2] += values[i + 2]
+            r[3] += values[i + 3]
+            r[4] += values[i + 4]
+            r[5] += values[i + 5]
+            r[6] += values[i + 6]
+            r[7] += values[i + 7]
+        total = ((r[0] + r[1]) + (r[2] + r[3])) + ((r[4] + r[5]) + (r[6] + r[7]))
+        for i in range(start + unrolled, start + count):
+            total += values[i]
+        return total
+    half = count // 2
+    half -= half % 8
+    return _pairwise_sum(values, start, half) + _pairwise_sum(values, start + half, count - half)
+
+def _column_mean(columns: Dict[str, list], name: str) -> Optional[float]:
+    """Mean that skips missing values like `Series.mean`, None if the column is not plainly numeric."""
+    values = columns[name]  # KeyError mirrors the pandas path
+    filled = []
+    count = 0
+    for value in values:
+        kind = type(value)
+        if kind is float:
+            if value != value:  # NaN
+                filled.append(0.0)
+            else:
+                filled.append(value)
+                count += 1
+        elif kind is int:
+            filled.append(float(value))
+            count += 1
+        elif value is None:
+            filled.append(0.0)
+        elif _is_number(value) and not _is_missing(value):
+            filled.append(float(value))
+            count += 1
+        elif _is_missing(value):
+            filled.append(0.0)
+        else:
+            return None
+    if count == 0:
+        return None
+    return _pairwise_sum(filled, 0, len(filled)) / count
+
+def _rainfall_flags(values: list) -> Optional[Tuple[List[Optional[int]], bool]]:
+    """
+    Map Rainfall values to 1/0/None the way `astype(str).str.lower().map(...)` does for
+    the dtype pandas would infer. Returns the flags and whether the column is boolean.
+    """
+    if all(isinstance(value, bool) for value in values):
+        return [1 if value else 0 for value in values], True
+    if all(_is_missing(value) or _is_number(value) for value in values):
+        if all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            # int64 column: '1' and '0' are recognised
+            return [_RAINFALL_FLAGS.get(str(value)) for value in values], False
+        # float64 column: every value renders as '1.0', 'nan', ... and maps to None
+        return [None] * len(values), False
+    if all(value is None or isinstance(value, (str, int, float)) for value in values):
+        return [None if _is_missing(value) else _RAINFALL_FLAGS.get(str(value).lower()) for value in values], False
+    return None
+
+def _analyze_columns(columns: Dict[str, list], total_samples: int) -> Optional[Dict[str, Any]]:
+    """
+    Single pass implementation over plain Python columns. Produces exactly the
+    `_analyze_with_pandas` output, or None to let the caller fall back to it.
+    """
+    if total_samples == 0:
+        return {
+            'weather_condition': WeatherCondition.UNKNOWN.value,
+            'condition_ratio': 0.0,
+            'average_temperature': 0.0,
+            'average_humidity': 0.0,
+            'wind_speed': 0.0
+        }
+    
+    flags = None
+    condition_ratio = 0.0
+    if 'Rainfall' in columns:
+        rainfall = _rainfall_flags(columns['Rainfall'])
+        if rainfall is None:
+            return None
+        flags, is_bool = rainfall
+        condition_ratio = sum(1 for flag in flags if flag == 1) / total_samples
+    
+    try:
+        avg_temp = _column_mean(columns, 'AirTemp')
+        avg_humidity = _column_mean(columns, 'Humidity')
+        avg_wind_speed = _column_mean(columns, 'WindSpeed') if 'WindSpeed' in columns else 0.0
+        if avg_temp is None or avg_humidity is None or avg_wind_speed is None:
+            return None
+    except KeyError as e:
+        print(f"Error calculating averages: {e}")
+        avg_temp = 0.0
+        avg_humidity = 0.0
+        avg_wind_speed = 0.0
+    
+    weather_condition = _determine_detailed_condition(
+        condition_ratio=condition_ratio,
+        avg_humidity=avg_humidity,
+        avg_wind_speed=avg_wind_speed,
+        is_rain_clearing=lambda: _is_rain_clearing(flags)
+    )
+    
+    if flags is not None and (is_bool or None not in flags):
+        # A fully mapped column sums to a numpy integer, so pandas rounds the ratio the numpy way
+        rounded_ratio = round(condition_ratio * 100) / 100
+    else:
+        rounded_ratio = round(condition_ratio, 2)
+    return _format_summary(weather_condition, rounded_ratio, avg_temp, avg_humidity, avg_wind_speed)
+
+def summarize_weather(weather: Union[Dict, List[Dict], None]) -> Optional[Dict[str, Any]]:
+    """
+    Summarize the raw weather samples stored on a session.
+    
+    Args:
+        weather: Raw `Session.weather` value, a list of samples or a single sample
+    
+    Returns:
+        Optional[Dict[str, Any]]: The `analyze_weather_conditions` result, or None when there is no data
+    """
+    if weather and isinstance(weather, list):
+        return analyze_weather_conditions(weather)
+    if weather and isinstance(weather, dict):
+        # Handle case where weather is a single data point
+        return analyze_weather_conditions([weather])
+    return None
+
 def _determine_detailed_condition(condition_ratio: float, avg_humidity: float, 
-                                avg_wind_speed: float, weather_data: pd.DataFrame) -> WeatherCondition:
+                                avg_wind_speed: float, is_rain_clearing: Callable[[], bool]) -> WeatherCondition:
     """Determine the detailed weather condition based on various factors."""
     # Check for windy conditions first (takes precedence over other conditions)
     if avg_wind_speed > 30:  # km/h
@@ -116,15 +310,8 @@ def _determine_detailed_condition(condition_ratio: float, avg_humidity: float,
     # Check rain-related conditions
     if condition_ratio > 0.5:  # More than 50% of the time it was raining
         # Check if rain is clearing (decreasing trend in rainfall)
-        if 'Rainfall' in weather_data.columns and len(weather_data) > 1:
-            try:
-                rain_changes = weather_data['Rainfall'].astype(str).str.lower().map(
-                    {'true': 1, 'false': 0, '1': 1, '0': 0, 1: 1, 0: 0, True: 1, False: 0}
-                ).diff().dropna()
-                if len(rain_changes) > 0 and rain_changes.iloc[-1] < 0:
-                    return WeatherCondition.RAINY_CLEARING
-            except:
-                pass
+        if is_rain_clearing():
+            return WeatherCondition.RAINY_CLEARING
         return WeatherCondition.RAINY
     elif condition_ratio > 0.1:  # Light rain/drizzle
         return WeatherCondition.DRIZZLE
@@ -132,6 +319,29 @@ def _determine_detailed_condition(condition_ratio: float, avg_humidity: float,
     # Default to dry if no other conditions are met
     return WeatherCondition.DRY
 
+def _is_rain_clearing_pandas(weather_data: 'pd.DataFrame') -> bool:
+    """Whether the last recorded change in rainfall was from wet to dry."""
+    if 'Rainfall' in weather_data.columns and len(weather_data) > 1:
+        try:
+            rain_changes = weather_data['Rainfall'].astype(str).str.lower().map(
+                {'true': 1, 'false': 0, '1': 1, '0': 0, 1: 1, 0: 0, True: 1, False: 0}
+            ).diff().dropna()
+            if len(rain_changes) > 0 and rain_changes.iloc[-1] < 0:
+                return True
+        except:
+            pass
+    return False
+
+def _is_rain_clearing(flags: Optional[List[Optional[int]]]) -> bool:
+    """Fast path equivalent of `_is_rain_clearing_pandas` over mapped rainfall flags."""
+    if flags is None or len(flags) < 2:
+        return False
+    for previous, current in zip(reversed(flags[:-1]), reversed(flags)):
+        # diff().dropna() keeps only steps where both neighbours are mapped
+        if previous is not None and current is not None:
+            return current - previous < 0
+    return False
+
 # Example usage with provided data
 if __name__ == "__main__":
     from src.core.database.database import SessionLocal
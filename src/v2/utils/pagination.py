@@ -0,0 +1,68 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+@dataclass
+class Page(Generic[T]):
+  """One page of a keyset-paginated listing; `next_key` is None on the last page."""
+  items: List[T]
+  next_key: Optional[Tuple[Any, ...]] = None
+
+def encode_cursor(key: Sequence[Any]) -> str:
+  """Opaque cursor for a keyset position such as (session_date, id)."""
+  values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+  raw = json.dumps(values, separators=(",", ":")).encode()
+  return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> Tuple[Any, ...]:
+  """
+  Decode a cursor produced by `encode_cursor`.
+  
+  Raises:
+    ValueError: If the cursor is malformed or does not match `types`
+  """
+  try:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    values = json.loads(raw)
+  except (ValueError, TypeError) as e:
+    raise ValueError("Invalid cursor") from e
+  if not isinstance(values, list) or len(values) != len(types):
+    raise ValueError("Invalid cursor")
+  
+  key = []
+  for value, value_type in zip(values, types):
+    if value_type is datetime:
+      if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+      key.append(datetime.fromisoformat(value))
+    elif value_type is int and isinstance(value, int) and not isinstance(value, bool):
+      key.append(value)
+    elif value_type is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+      key.append(float(value))
+    else:
+      raise ValueError("Invalid cursor")
+  return tuple(key)
+
+def parse_cursor(cursor: Optional[str], types: Sequence[type]) -> Optional[Tuple[Any, ...]]:
+  """`decode_cursor` for query parameters, answering 400 on a malformed cursor."""
+  if cursor is None:
+    return None
+  try:
+    return decode_cursor(cursor, types)
+  except ValueError:
+    raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def paginate(rows: List[Any], limit: int, key_of) -> Tuple[List[Any], Optional[Tuple[Any, ...]]]:
+  """Split `limit + 1` fetched rows into the page and the key to continue after."""
+  if len(rows) > limit:
+    rows = rows[:limit]
+    return rows, key_of(rows[-1])
+  return rows, None
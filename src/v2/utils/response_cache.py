@@ -0,0 +1,112 @@
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from fastapi import Request, Response
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from src.core.cache import TTLCache
+from src.core.config import Settings
+from src.core.responses import dumps
+from src.v2.repositories.data_versions import AsyncDataVersionRepository
+from src.v2.utils.pagination import Page, encode_cursor
+
+settings = Settings()
+
+response_cache = TTLCache(max_entries=settings.CACHE_MAX_ENTRIES, max_bytes=settings.CACHE_MAX_BYTES)
+
+_versions: Dict[str, int] = {}
+_versions_checked_at = float("-inf")
+
+async def get_data_versions(db: AsyncSession) -> Dict[str, int]:
+  """
+  Crawler-maintained data versions, read from the database at most once
+  every CACHE_VERSION_CHECK_INTERVAL seconds.
+  """
+  global _versions, _versions_checked_at
+  now = time.monotonic()
+  if now - _versions_checked_at < settings.CACHE_VERSION_CHECK_INTERVAL:
+    return _versions
+  
+  # Claim the refresh before awaiting so concurrent requests keep the current versions
+  _versions_checked_at = now
+  try:
+    _versions = await AsyncDataVersionRepository(db).get_versions()
+  except SQLAlchemyError as e:
+    # Without versions the TTL alone bounds staleness
+    await db.rollback()
+    print(f"⚠️  Could not read data versions: {str(e)}")
+  return _versions
+
+def render_json(data: Any) -> bytes:
+  return dumps(data)
+
+def render(request: Request, data: Any) -> Tuple[bytes, Dict[str, str]]:
+  """Serialize route data. A `Page` becomes its item list plus next-page headers."""
+  if not isinstance(data, Page):
+    return render_json(data), {}
+  headers = {}
+  if data.next_key is not None:
+    next_cursor = encode_cursor(data.next_key)
+    # Relative link, so cached entries do not depend on the Host header
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    headers = {"Link": f'<{next_url.path}?{next_url.query}>; rel="next"', "X-Next-Cursor": next_cursor}
+  return render_json(data.items), headers
+
+def make_etag(key: Tuple[Hashable, ...], versions: Tuple[int, ...]) -> Optional[str]:
+  """
+  Strong ETag for a response, derived from its cache key and data versions.
+  None while any data set has never been versioned by a crawler.
+  """
+  if not versions or not all(versions):
+    return None
+  digest = hashlib.sha1(repr((settings.VERSION, key, versions)).encode()).hexdigest()
+  return f'"{digest}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+  if not if_none_match:
+    return False
+  if if_none_match.strip() == "*":
+    return True
+  # If-None-Match uses the weak comparison function
+  candidates = (tag.strip() for tag in if_none_match.split(","))
+  return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+async def cached_response(
+  request: Request,
+  db: AsyncSession,
+  key: Tuple[Hashable, ...],
+  tables: Tuple[str, ...],
+  ttl: float,
+  loader: Callable[[], Awaitable[Any]]
+) -> Response:
+  """
+  Serve `await loader()` as JSON through the response cache, answering 304 when the
+  client already holds the current version. ETags and 304s do not depend on
+  CACHE_ENABLED, which only turns off storing rendered bodies.
+  
+  Args:
+    key: Route name followed by the query parameters of the request
+    tables: Data sets the response depends on; bumping any of them invalidates it
+    ttl: Seconds an entry may be served without a version change
+    loader: Async repository call producing the response data
+  """
+  data_versions = await get_data_versions(db)
+  versions = tuple(data_versions.get(table, 0) for table in tables)
+  
+  headers = {}
+  etag = make_etag(key, versions)
+  if etag:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+      return Response(status_code=304, headers=headers)
+  
+  cache_key = key + versions
+  entry = response_cache.get(cache_key) if settings.CACHE_ENABLED else None
+  if entry is None:
+    # Serializing a large listing would otherwise stall the event loop
+    entry = await run_in_threadpool(render, request, await loader())
+    if settings.CACHE_ENABLED:
+      response_cache.set(cache_key, entry, ttl, size=len(entry[0]))
+  body, page_headers = entry
+  return Response(content=body, media_type="application/json", headers={**headers, **page_headers})
@@ -0,0 +1,36 @@
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database.base import Base
+import src.v2.models  # noqa: F401  registers every table on Base.metadata
+
+@pytest.fixture
+def engine() -> Engine:
+  # One in-memory SQLite database per test, shared by every connection of the engine
+  engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+  Base.metadata.create_all(engine)
+  yield engine
+  engine.dispose()
+
+@pytest.fixture
+def db(engine):
+  session = sessionmaker(bind=engine, autoflush=False)()
+  yield session
+  session.close()
+
+@pytest.fixture
+def queries(engine) -> List[str]:
+  """SQL statements executed on `engine` from the moment the fixture is requested."""
+  statements = []
+  
+  def record(conn, cursor, statement, parameters, context, executemany):
+    statements.append(statement)
+  
+  event.listen(engine, "before_cursor_execute", record)
+  yield statements
+  event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.core.database.base import Base
+from src.v2.models import DataVersion
+from src.v2.utils import response_cache
+from src.v2.utils.response_cache import cached_response
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+  """A one-route app over a SQLite file whose `news` data set is at version 3."""
+  path = tmp_path / "cache.db"
+  engine = create_engine(f"sqlite:///{path}")
+  Base.metadata.create_all(engine)
+  with Session(engine) as db:
+    db.add(DataVersion(name="news", version=3, updated_at=datetime.now(timezone.utc)))
+    db.commit()
+  engine.dispose()
+  
+  async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+  sessions = async_sessionmaker(bind=async_engine, class_=AsyncSession)
+  
+  async def get_db():
+    async with sessions() as db:
+      yield db
+  
+  app = FastAPI()
+  app.state.loads = 0
+  
+  @app.get("/news")
+  async def news(request: Request, db: AsyncSession = Depends(get_db)):
+    async def load():
+      app.state.loads += 1
+      return [{"id": 1}]
+    return await cached_response(request, db, ("news",), ("news",), 60, load)
+  
+  monkeypatch.setattr(response_cache.settings, "CACHE_VERSION_CHECK_INTERVAL", 0.0)
+  response_cache.response_cache.clear()
+  with TestClient(app) as client:
+    yield client
+  response_cache.response_cache.clear()
+
+def test_etag_and_304_without_the_response_cache(client, monkeypatch):
+  monkeypatch.setattr(response_cache.settings, "CACHE_ENABLED", False)
+  
+  first = client.get("/news")
+  assert first.status_code == 200
+  assert first.headers["etag"]
+  
+  revalidated = client.get("/news", headers={"If-None-Match": first.headers["etag"]})
+  assert revalidated.status_code == 304
+  assert revalidated.headers["etag"] == first.headers["etag"]
+  
+  again = client.get("/news")
+  assert again.json() == [{"id": 1}]
+  assert client.app.state.loads == 2  # nothing is stored, a 304 never loads
+
+def test_response_cache_stores_the_body(client, monkeypatch):
+  monkeypatch.setattr(response_cache.settings, "CACHE_ENABLED", True)
+  
+  etags = {client.get("/news").headers["etag"] for _ in range(3)}
+  
+  assert len(etags) == 1
+  assert client.app.state.loads == 1
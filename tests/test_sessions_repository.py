@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+from src.v2.models import Result, Session
+from src.v2.repositories.sessions import ResultLoading, SessionRepository
+
+def add_sessions(db, count: int, without_results: int):
+  """`count` sessions in calendar order; the last `without_results` have not been raced yet."""
+  start = datetime(2025, 3, 1)
+  for n in range(count):
+    db.add(Session(
+      id=n + 1, year=2025, round=n // 5 + 1, session_type="Race", session_name="Race",
+      session_date=start + timedelta(days=n), circuit_id=1, status="Completed"
+    ))
+    if n < count - without_results:
+      db.add_all(Result(session_id=n + 1, driver_number=driver, position=driver, points=0.0) for driver in (1, 4))
+  db.commit()
+  db.expunge_all()
+
+def test_sparse_results_are_batched_for_sessions_without_results(db, queries):
+  add_sessions(db, 15, without_results=3)
+  queries.clear()
+  
+  page = SessionRepository(db).get_sessions_page(15, fields=("id",), include=("results",))
+  
+  assert len(queries) == 2  # the sessions, then every result in one IN (...) query
+  assert [len(session["results"]) for session in page.items] == [2] * 12 + [0] * 3
+
+def test_dynamic_loading_queries_each_session(db, queries):
+  add_sessions(db, 4, without_results=1)
+  queries.clear()
+  
+  page = SessionRepository(db, result_loading=ResultLoading.DYNAMIC).get_sessions_page(4, fields=("id",), include=("results",))
+  
+  assert len(queries) == 1 + 4
+  assert [len(session["results"]) for session in page.items] == [2, 2, 2, 0]
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+
+from src.v2.models import Driver, Result, Session, Team
+from src.v2.repositories.standings import StandingRepository
+
+def add_team(db, constructor_id: str):
+  db.add(Team(
+    constructorId=constructor_id, name=constructor_id, nationality="", teamColor="",
+    logoURL="", carURL="", countryFlagURL=""
+  ))
+
+def add_driver(db, number: int, team: str):
+  db.add(Driver(
+    driverId=f"driver_{number}", permanentNumber=number, givenName="", familyName="", nameAcronym="",
+    dateOfBirth=datetime(2000, 1, 1), nationality="", headshotURL="", countryFlagURL="", currentTeam=team
+  ))
+
+def add_race(db, session_id: int):
+  db.add(Session(
+    id=session_id, year=2025, round=session_id, session_type="Race", session_name="Race",
+    session_date=datetime(2025, 3, session_id), circuit_id=1, status="Completed"
+  ))
+
+def standings(db):
+  repository = StandingRepository(db)
+  repository.refresh()
+  teams = {standing.constructor_id: (standing.points, standing.wins, standing.podiums) for standing in repository.get_team_standings()}
+  drivers = {standing.driver_number: standing.points for standing in repository.get_driver_standings()}
+  return teams, drivers
+
+@pytest.fixture
+def grid(db):
+  """Driver 7 wins round 1 for alpine, then replaces driver 4 at mclaren for round 2."""
+  for team in ("alpine", "mclaren"):
+    add_team(db, team)
+  add_driver(db, 7, "mclaren")
+  add_driver(db, 4, "mclaren")
+  add_driver(db, 10, "alpine")
+  for session_id in (1, 2):
+    add_race(db, session_id)
+  db.commit()
+  return db
+
+def test_team_points_stay_with_the_team_they_were_scored_for(grid):
+  grid.add_all([
+    Result(session_id=1, driver_number=7, constructor_id="alpine", position=1, points=25.0),
+    Result(session_id=1, driver_number=4, constructor_id="mclaren", position=2, points=18.0),
+    Result(session_id=2, driver_number=7, constructor_id="mclaren", position=3, points=15.0),
+    Result(session_id=2, driver_number=10, constructor_id="alpine", position=4, points=12.0),
+  ])
+  grid.commit()
+  
+  teams, drivers = standings(grid)
+  
+  assert teams == {"alpine": (37.0, 1, 1), "mclaren": (33.0, 0, 2)}
+  assert drivers == {7: 40.0, 4: 18.0, 10: 12.0}
+
+def test_results_without_a_team_fall_back_to_the_current_team(grid):
+  # Rows ingested before teams were recorded
+  grid.add(Result(session_id=1, driver_number=10, position=1, points=25.0))
+  grid.commit()
+  
+  teams, _ = standings(grid)
+  
+  assert teams == {"alpine": (25.0, 1, 1), "mclaren": (0.0, 0, 0)}
+
+def test_ingest_keeps_the_team_of_past_sessions_after_a_swap(grid):
+  get_results = pytest.importorskip("src.v2.crawler.get_results", exc_type=ImportError)
+  known_teams = get_results.get_known_teams(grid)
+  
+  def ingest(session_id, constructor_id=None):
+    driver_teams = get_results.get_driver_teams(grid)
+    rows = [{"session_id": session_id, "driver_number": 7, "position": 1, "points": 25.0, "constructor_id": constructor_id}]
+    get_results.save_results(grid, get_results.assign_constructors(rows, driver_teams, known_teams), set(driver_teams))
+  
+  grid.query(Driver).filter(Driver.permanentNumber == 7).update({"currentTeam": "alpine"})
+  ingest(1)  # no TeamId from fastf1: the team at ingest time
+  grid.query(Driver).filter(Driver.permanentNumber == 7).update({"currentTeam": "mclaren"})
+  ingest(2, "mclaren")
+  ingest(1)  # re-ingesting round 1 after the swap keeps alpine
+  
+  teams, _ = standings(grid)
+  
+  assert teams == {"alpine": (25.0, 1, 1), "mclaren": (25.0, 1, 1)}